@@ -5,14 +5,13 @@ Prefect-powered workflow for managing benchmark runs.
 """
 
 import sys
-from pathlib import Path
 
-import yaml
 from prefect import flow, task
 
 from runner import (
     BuildState,
     DatasetManager,
+    DisplayBuffer,
     check_and_display_builds,
     check_containers,
     check_evaluation_container,
@@ -23,6 +22,7 @@ from runner import (
     display_algorithms,
     get_algorithms,
     get_outputs_needing_augmentation,
+    load_yaml_cached,
     print_banner,
     print_header,
     print_info,
@@ -33,14 +33,15 @@ from runner import (
     submit_and_wait_for_evaluation,
     submit_and_wait_for_pull,
     submit_and_wait_for_run,
+    submit_build_array,
 )
+from runner.paths import RUNNER_DIR
 
 
 @task(name="Load Configuration")
 def load_config() -> dict:
-    config_path = Path(__file__).parent / "config.yaml"
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+    config_path = RUNNER_DIR / "config.yaml"
+    return load_yaml_cached(config_path)
 
 
 @task(name="Analyze Missing Combinations")
@@ -59,10 +60,7 @@ def analyze_missing(
     datasets = config["datasets"]
 
     # Calculate all possible combinations
-    all_combinations = set()
-    for algo in algorithms:
-        for dataset in datasets:
-            all_combinations.add((algo["name"], dataset))
+    all_combinations = {(algo["name"], dataset) for algo in algorithms for dataset in datasets}
 
     # Find missing
     missing = all_combinations - existing_outputs
@@ -76,43 +74,40 @@ def analyze_missing(
     print_info(f"Missing outputs: {len(missing)}")
 
     # Group by container status
-    missing_with_container = []
-    missing_without_container = []
-
-    for algo_name, dataset in sorted(missing):
-        if container_status.get(algo_name, False):
-            missing_with_container.append((algo_name, dataset))
-        else:
-            missing_without_container.append((algo_name, dataset))
-
-    if missing_with_container:
-        print_step("Ready to run (container exists):")
-        for algo, dataset in missing_with_container:
-            print(f"    ✓ {algo} + {dataset}")
-
-    if missing_without_container:
-        print_step("Need container first (container missing):")
-        for algo, dataset in missing_without_container:
-            print(f"    ⚠ {algo} + {dataset}")
+    container_ok = frozenset(name for name, exists in container_status.items() if exists)
+    missing_sorted = sorted(missing)
+    missing_with_container = [combo for combo in missing_sorted if combo[0] in container_ok]
+    missing_without_container = [combo for combo in missing_sorted if combo[0] not in container_ok]
 
     # Extract needed datasets (only for missing combinations)
     needed_datasets = set(dataset for _, dataset in missing)
 
-    # Summary
-    print_header("Summary")
-    print(f"  • Algorithms found: {len(algorithms)}")
-    print(f"  • Datasets configured: {len(datasets)}")
-    print(f"  • Total combinations: {len(all_combinations)}")
-    print(f"  • Completed: {len(existing_outputs)}")
-    print(f"  • Missing: {len(missing)}")
-    print(f"    - Ready to run: {len(missing_with_container)}")
-    print(f"    - Need container: {len(missing_without_container)}")
+    with DisplayBuffer() as out:
+        if missing_with_container:
+            print_step("Ready to run (container exists):")
+            for algo, dataset in missing_with_container:
+                out.emit(f"    ✓ {algo} + {dataset}")
+
+        if missing_without_container:
+            print_step("Need container first (container missing):")
+            for algo, dataset in missing_without_container:
+                out.emit(f"    ⚠ {algo} + {dataset}")
+
+        # Summary
+        print_header("Summary")
+        out.emit(f"  • Algorithms found: {len(algorithms)}")
+        out.emit(f"  • Datasets configured: {len(datasets)}")
+        out.emit(f"  • Total combinations: {len(all_combinations)}")
+        out.emit(f"  • Completed: {len(existing_outputs)}")
+        out.emit(f"  • Missing: {len(missing)}")
+        out.emit(f"    - Ready to run: {len(missing_with_container)}")
+        out.emit(f"    - Need container: {len(missing_without_container)}")
 
     return missing_with_container, needed_datasets
 
 
 def read_error_log(log_pattern: str, lines: int = 20) -> str:
-    log_dir = Path(__file__).parent / "logs"
+    log_dir = RUNNER_DIR / "logs"
     error_logs = list(log_dir.glob(log_pattern))
     if not error_logs:
         return ""
@@ -124,11 +119,17 @@ def read_error_log(log_pattern: str, lines: int = 20) -> str:
 
 @task(task_run_name="Build Container: {algo_name}")
 def build_single_container(
-    config: dict, algo_name: str, version: str, build_state: BuildState
+    config: dict,
+    algo_name: str,
+    version: str,
+    build_state: BuildState,
+    job_id: str | None = None,
 ) -> bool:
-    """Build a single container and wait for completion."""
+    """Build a single container and wait for completion (submitting it unless job_id given)."""
     print_info(f"Building {algo_name} ({version})...")
-    success, job_id = submit_and_wait_for_build(config, algo_name, version, build_state)
+    success, job_id = submit_and_wait_for_build(
+        config, algo_name, version, build_state, job_id=job_id
+    )
     if success:
         print_success(f"✓ {algo_name} ({version}) built successfully")
         return True
@@ -230,7 +231,7 @@ def cleanup_workspace() -> None:
     print_header("Cleanup Before Starting")
     import shutil
 
-    runner_dir = Path(__file__).parent
+    runner_dir = RUNNER_DIR
 
     # Remove all old logs
     logs_dir = runner_dir / "logs"
@@ -285,9 +286,9 @@ def cleanup_workspace() -> None:
 
 
 @task(name="Ensure denovo-benchmarks Repository")
-def check_repository(config: dict) -> None:
-    """Check, clone, or update the benchmarks repository."""
-    check_or_clone_repo(config)
+def check_repository(config: dict) -> bool:
+    """Check, clone, or update the benchmarks repository. Returns True if it changed."""
+    return check_or_clone_repo(config).changed
 
 
 @task(name="Discover available algorithms")
@@ -344,7 +345,7 @@ def check_outputs_needing_augmentation(
 def scan_existing_datasets() -> set[str]:
     """Scan for datasets already on Asimov and update state."""
     dataset_manager = DatasetManager()
-    datasets_dir = Path(__file__).parent / "datasets"
+    datasets_dir = RUNNER_DIR / "datasets"
 
     if datasets_dir.exists():
         print_step("Scanning for existing datasets on Asimov...")
@@ -439,8 +440,7 @@ def find_datasets_needing_evaluation(
     datasets = config["datasets"]
     algo_names = {algo["name"] for algo in algorithms}
 
-    runner_dir = Path(__file__).parent
-    benchmarks_dir = runner_dir / config["denovo_benchmarks"]["local_path"]
+    benchmarks_dir = RUNNER_DIR / config["denovo_benchmarks"]["local_path"]
     results_dir = benchmarks_dir / "results"
 
     expected_result_files = [
@@ -593,15 +593,23 @@ def main():
     # Load config
     config = load_config()
 
-    # Run independent tasks in parallel
+    # Algorithm discovery reads the checkout. If it already exists, discover from
+    # it while the fetch is in flight and redo discovery only if the repo changed;
+    # a first run has to wait for the clone. Checked before the repo task starts,
+    # since a clone in progress creates the directory right away.
+    benchmarks_dir = RUNNER_DIR / config["denovo_benchmarks"]["local_path"]
+    overlapped_fetch = benchmarks_dir.exists()
+
+    # Run independent tasks in parallel (local git, Alexandria listing, Alexandria probe)
     cleanup_future = cleanup_workspace.submit()
     repo_future = check_repository.submit(config)
     outputs_future = check_alexandria_outputs.submit(config)
+    evaluation_future = check_evaluation_container_task.submit(config)
 
-    # Wait for all parallel tasks
     cleanup_future.result()
-    repo_future.result()
-    existing_outputs = outputs_future.result()
+
+    if not overlapped_fetch:
+        repo_future.result()
 
     # Discover algorithms
     algorithms = discover_algorithms(config)
@@ -609,8 +617,15 @@ def main():
     # Check containers
     container_status = check_container_status(config, algorithms)
 
-    # Check evaluation container
-    evaluation_exists = check_evaluation_container_task(config)
+    # After a clone, discovery already saw the final checkout
+    if overlapped_fetch and repo_future.result():
+        print_step("Repository changed - rediscovering algorithms...")
+        algorithms = discover_algorithms(config)
+        container_status = check_container_status(config, algorithms)
+
+    # Collect the Alexandria checks that ran alongside the steps above
+    existing_outputs = outputs_future.result()
+    evaluation_exists = evaluation_future.result()
 
     # Check and manage container builds
     needs_building, build_state = analyze_container_builds(config, algorithms, container_status)
@@ -625,10 +640,18 @@ def main():
         print_header("Building Algorithm Containers (Parallel)")
         print_info(f"Submitting {len(needs_building)} build jobs in parallel...")
 
-        # Submit all builds in parallel directly from flow
+        # Submit all builds as one Slurm array job; any build the array did not
+        # take is submitted on its own by its build task
+        job_ids = {}
+        if len(needs_building) > 1:
+            job_ids = submit_build_array(config, needs_building, build_state)
+
+        # Wait on all builds in parallel directly from flow
         build_futures = []
         for algo_name, version in needs_building:
-            future = build_single_container.submit(config, algo_name, version, build_state)
+            future = build_single_container.submit(
+                config, algo_name, version, build_state, job_ids.get((algo_name, version))
+            )
             build_futures.append(future)
 
         # Wait for all to complete and count successes
@@ -641,10 +664,12 @@ def main():
                 pass  # Task already logged the error, just count as failure
         print_info(f"Built {built_count}/{len(needs_building)} containers")
 
-        # Re-check container status after builds complete
+        # Re-check container status after builds complete; the evaluation probe
+        # runs in the background while the algorithm containers are checked
         print_step("Rechecking container status...")
+        evaluation_future = check_evaluation_container_task.submit(config)
         container_status = check_containers(config, algorithms)
-        evaluation_exists = check_evaluation_container_task(config)
+        evaluation_exists = evaluation_future.result()
 
     # Pull evaluation container if it exists on Alexandria
     if evaluation_exists:
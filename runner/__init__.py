@@ -20,6 +20,7 @@ from .container_builder import (
     check_and_build_evaluation_container,
     check_and_display_builds,
     submit_and_wait_for_build,
+    submit_build_array,
     submit_build_job,
     submit_evaluation_build,
 )
@@ -30,6 +31,7 @@ from .dataset_manager import (
     submit_pull_job,
 )
 from .display import (
+    DisplayBuffer,
     print_banner,
     print_error,
     print_header,
@@ -38,8 +40,9 @@ from .display import (
     print_success,
     print_warning,
 )
-from .git_ops import check_or_clone_repo
+from .git_ops import RepoStatus, check_or_clone_repo, check_or_clone_repos
 from .job_waiter import wait_for_job_completion
+from .parse_cache import load_yaml_cached
 
 __all__ = [
     "get_algorithms",
@@ -48,7 +51,10 @@ __all__ = [
     "check_containers",
     "check_container_exists",
     "check_evaluation_container",
+    "RepoStatus",
     "check_or_clone_repo",
+    "check_or_clone_repos",
+    "DisplayBuffer",
     "print_header",
     "print_banner",
     "print_step",
@@ -61,6 +67,7 @@ __all__ = [
     "check_and_display_builds",
     "check_and_build_evaluation_container",
     "submit_build_job",
+    "submit_build_array",
     "submit_and_wait_for_build",
     "submit_evaluation_build",
     "submit_pull_job",
@@ -73,4 +80,5 @@ __all__ = [
     "check_output_exists_on_alexandria",
     "cleanup_local_container",
     "get_outputs_needing_augmentation",
+    "load_yaml_cached",
 ]
@@ -1,14 +1,19 @@
 """Alexandria storage operations."""
 
-from pathlib import Path
-
-from .display import print_header, print_info, print_step, print_success, print_warning
+from .display import (
+    DisplayBuffer,
+    print_header,
+    print_info,
+    print_step,
+    print_success,
+    print_warning,
+)
 from .remote_fs import (
-    remote_dir_exists,
     remote_file_exists,
-    remote_find,
+    remote_find_or_create,
     remote_mkdir,
-    remote_read_first_line,
+    remote_read_first_lines,
+    remote_test_many,
 )
 
 
@@ -24,36 +29,47 @@ def check_outputs(config: dict) -> set[tuple[str, str]]:
 
     print_step(f"Checking outputs on Alexandria at {outputs_path}...")
 
-    # Check if outputs directory exists
-    if not remote_dir_exists(host, outputs_path):
+    # Existence check, mkdir and listing all happen in one SSH session.
+    # Path format: /mnt/data/nkubrakov/denovo_benchmarks/outputs/algo/version/dataset,
+    # reduced remotely to sorted, unique "algo<TAB>dataset" lines.
+    found_pairs = remote_find_or_create(
+        host, outputs_path, mindepth=3, maxdepth=3, type_="d", fields=(-3, -1)
+    )
+    if found_pairs is None:
         print_info("Outputs directory does not exist on Alexandria yet")
-        print_step(f"Creating directory: {outputs_path}")
-        remote_mkdir(host, outputs_path)
+        print_step(f"Created directory: {outputs_path}")
         return set()
 
-    # List outputs
-    found_paths = remote_find(host, outputs_path, mindepth=3, maxdepth=3, type_="d")
-
-    existing = set()
-    if found_paths:
-        for path in found_paths:
-            # Path format: /mnt/data/nkubrakov/denovo_benchmarks/outputs/algo/version/dataset
-            parts = Path(path).parts
-            if len(parts) >= 3:
-                algo = parts[-3]
-                dataset = parts[-1]
-                existing.add((algo, dataset))
+    pairs = [tuple(line.split("\t", 1)) for line in found_pairs if "\t" in line]
+    existing = set(pairs)
 
     if existing:
-        print_success(f"Found {len(existing)} existing output(s)")
-        for algo, dataset in sorted(existing):
-            print(f"    • {algo} + {dataset}")
+        with DisplayBuffer() as out:
+            print_success(f"Found {len(existing)} existing output(s)")
+            for algo, dataset in pairs:
+                out.emit(f"    • {algo} + {dataset}")
     else:
         print_info("No outputs found yet")
 
     return existing
 
 
+def container_path(containers_base: str, algo_name: str, version: str) -> str:
+    """Return the Alexandria path of a built container (evaluation has its own layout)."""
+    if algo_name == "evaluation":
+        return f"{containers_base}/evaluation/evaluation.sif"
+    return f"{containers_base}/{algo_name}/{version}/container.sif"
+
+
+def container_paths(config: dict, builds: list[tuple[str, str]]) -> dict[tuple[str, str], str]:
+    """Map each (algo_name, version) in *builds* to its container path on Alexandria."""
+    containers_base = config["alexandria"]["containers_path"]
+    return {
+        (algo_name, version): container_path(containers_base, algo_name, version)
+        for algo_name, version in builds
+    }
+
+
 def check_evaluation_container(config: dict) -> bool:
     """
     Check if evaluation container exists on Alexandria.
@@ -61,9 +77,8 @@ def check_evaluation_container(config: dict) -> bool:
     """
     host = config["alexandria"]["host"]
     containers_base = config["alexandria"]["containers_path"]
-    evaluation_path = f"{containers_base}/evaluation/evaluation.sif"
 
-    return remote_file_exists(host, evaluation_path)
+    return remote_file_exists(host, container_path(containers_base, "evaluation", "evaluation"))
 
 
 def check_container_exists(config: dict, algo_name: str, version: str) -> bool:
@@ -74,13 +89,7 @@ def check_container_exists(config: dict, algo_name: str, version: str) -> bool:
     host = config["alexandria"]["host"]
     containers_base = config["alexandria"]["containers_path"]
 
-    # Special handling for evaluation container
-    if algo_name == "evaluation":
-        container_path = f"{containers_base}/evaluation/evaluation.sif"
-    else:
-        container_path = f"{containers_base}/{algo_name}/{version}/container.sif"
-
-    return remote_file_exists(host, container_path)
+    return remote_file_exists(host, container_path(containers_base, algo_name, version))
 
 
 def check_containers(config: dict, algorithms: list[dict[str, str]]) -> dict[str, bool]:
@@ -95,8 +104,13 @@ def check_containers(config: dict, algorithms: list[dict[str, str]]) -> dict[str
 
     print_step(f"Checking containers on Alexandria at {containers_base}...")
 
-    # Check if containers directory exists
-    if not remote_dir_exists(host, containers_base):
+    paths = container_paths(config, [(algo["name"], algo["version"]) for algo in algorithms])
+
+    # Probe the containers directory and every container in a single SSH session
+    checks = [("-d", containers_base)] + [("-f", path) for path in paths.values()]
+    base_exists, *containers_exist = remote_test_many(host, checks)
+
+    if not base_exists:
         print_info("Containers directory does not exist on Alexandria yet")
         print_step(f"Creating directory: {containers_base}")
         remote_mkdir(host, containers_base)
@@ -104,22 +118,34 @@ def check_containers(config: dict, algorithms: list[dict[str, str]]) -> dict[str
 
     container_status = {}
 
-    for algo in algorithms:
-        algo_name = algo["name"]
-        algo_version = algo["version"]
-        container_path = f"{containers_base}/{algo_name}/{algo_version}/container.sif"
-
-        exists = remote_file_exists(host, container_path)
-        container_status[algo_name] = exists
+    with DisplayBuffer():
+        for algo, exists in zip(algorithms, containers_exist):
+            algo_name = algo["name"]
+            algo_version = algo["version"]
+            container_status[algo_name] = exists
 
-        if exists:
-            print_success(f"{algo_name} ({algo_version}): Container exists")
-        else:
-            print_warning(f"{algo_name} ({algo_version}): Container missing")
+            if exists:
+                print_success(f"{algo_name} ({algo_version}): Container exists")
+            else:
+                print_warning(f"{algo_name} ({algo_version}): Container missing")
 
     return container_status
 
 
+def _header_needs_augmentation(header: str | None) -> bool:
+    """Return True if an output.csv header lacks the SA or pred_RT column."""
+    if header is None:
+        return False
+
+    # Check if SA and pred_RT columns exist
+    columns = header.split(",")
+    has_sa = "SA" in columns
+    has_pred_rt = "pred_RT" in columns
+
+    # Needs augmentation if either column is missing
+    return not (has_sa and has_pred_rt)
+
+
 def check_output_needs_augmentation(
     config: dict, algo_name: str, version: str, dataset: str
 ) -> bool:
@@ -131,21 +157,9 @@ def check_output_needs_augmentation(
     outputs_path = config["alexandria"]["outputs_path"]
     output_csv = f"{outputs_path}/{algo_name}/{version}/{dataset}/output.csv"
 
-    # Check if output.csv exists
-    if not remote_file_exists(host, output_csv):
-        return False
-
-    # Read just the header line to check columns
-    header = remote_read_first_line(host, output_csv)
-    if header is None:
-        return False
-
-    # Check if SA and pred_RT columns exist
-    has_sa = "SA" in header.split(",")
-    has_pred_rt = "pred_RT" in header.split(",")
-
-    # Needs augmentation if either column is missing
-    return not (has_sa and has_pred_rt)
+    # Read just the header line to check columns (None if output.csv is missing)
+    [header] = remote_read_first_lines(host, [output_csv])
+    return _header_needs_augmentation(header)
 
 
 def get_outputs_needing_augmentation(
@@ -157,19 +171,32 @@ def get_outputs_needing_augmentation(
     """
     print_header("Checking Outputs for Augmentation")
 
+    host = config["alexandria"]["host"]
+    outputs_path = config["alexandria"]["outputs_path"]
+
     needs_augmentation = []
 
     # Create algo version lookup
     algo_versions = {algo["name"]: algo["version"] for algo in algorithms}
 
-    for algo_name, dataset in existing_outputs:
-        if algo_name not in algo_versions:
-            continue
-
-        version = algo_versions[algo_name]
-
+    candidates = [
+        (algo_name, algo_versions[algo_name], dataset)
+        for algo_name, dataset in existing_outputs
+        if algo_name in algo_versions
+    ]
+
+    # Read every output.csv header in one SSH session instead of two calls per output
+    headers = remote_read_first_lines(
+        host,
+        [
+            f"{outputs_path}/{algo_name}/{version}/{dataset}/output.csv"
+            for algo_name, version, dataset in candidates
+        ],
+    )
+
+    for (algo_name, version, dataset), header in zip(candidates, headers):
         print_step(f"Checking {algo_name} + {dataset}...")
-        if check_output_needs_augmentation(config, algo_name, version, dataset):
+        if _header_needs_augmentation(header):
             print_warning("  ⚠ Missing augmentation (no SA/pred_RT)")
             needs_augmentation.append((algo_name, version, dataset))
         else:
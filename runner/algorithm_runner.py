@@ -2,10 +2,10 @@
 
 from pathlib import Path
 
-from .container_builder import get_runner_dir
+from .container_builder import get_runner_dir, read_template
 from .display import print_info, print_step, print_success
 from .job_waiter import wait_for_job_completion
-from .remote_fs import remote_file_exists, rsync_pull
+from .remote_fs import RSYNC_SSH, remote_file_exists, rsync_pull, ssh_run
 
 
 def get_slurm_resources_for_run(config: dict) -> dict:
@@ -97,8 +97,7 @@ def submit_run_job(
 
     template_path = runner_dir / "templates" / "run_algorithm.slurm.sh"
 
-    with open(template_path, "r") as f:
-        template = f.read()
+    template = read_template(template_path)
 
     # Format template
     job_script = template.format(
@@ -233,8 +232,7 @@ def augment_existing_output(config: dict, algo_name: str, version: str, dataset:
 
     # Read and fill augmentation template
     template_path = runner_dir / "templates" / "augment_output.slurm.sh"
-    with open(template_path) as f:
-        template = f.read()
+    template = read_template(template_path)
 
     # Fill template
     job_script = template.format(
@@ -323,8 +321,7 @@ def submit_evaluation_job(
 
     template_path = runner_dir / "templates" / "evaluate_dataset.slurm.sh"
 
-    with open(template_path, "r") as f:
-        template = f.read()
+    template = read_template(template_path)
 
     # Get Slurm resources from config or use defaults
     if slurm_resources is None:
@@ -438,8 +435,9 @@ def submit_and_wait_for_evaluation(
         f"find {shlex.quote(alexandria_outputs_path)} "
         f"-mindepth 3 -maxdepth 3 -type d -name {shlex.quote(dataset)}"
     )
-    find_result = subprocess.run(
-        ["ssh", alexandria_host, find_cmd],
+    find_result = ssh_run(
+        alexandria_host,
+        find_cmd,
         capture_output=True,
         text=True,
     )
@@ -486,6 +484,8 @@ def submit_and_wait_for_evaluation(
                 "rsync",
                 "-az",
                 "--delete",
+                "-e",
+                RSYNC_SSH,
                 f"{alexandria_host}:{remote_dataset_dir}/",
                 f"{local_dataset_dir}/",
             ],
@@ -1,8 +1,47 @@
 """Algorithm discovery and version management."""
 
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from .display import print_header, print_success, print_warning
+from .display import DisplayBuffer, print_header, print_success, print_warning
+from .parse_cache import deferred_writes, load_cached
+from .paths import RUNNER_DIR
+
+# Rest of the first line holding a `container_version:` entry in a versions.log
+_VERSION_LINE_RE = re.compile(rb"container_version:([^\n]*)")
+# The quoted version on that line
+_QUOTED_RE = re.compile(rb'"([^"]*)"')
+
+
+def _parse_versions_log(versions_file: Path) -> str | None:
+    """
+    Return the first container_version from a versions.log, or None if absent.
+    Raises ValueError if that first entry has no quoted version.
+    """
+    with open(versions_file, "rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        # Scan the mapped file in C instead of splitting it into Python lines
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            line = _VERSION_LINE_RE.search(content)
+            if line is None:
+                return None
+            # Only the first entry counts; a later quoted one must not stand in for it
+            match = _QUOTED_RE.search(line.group(1))
+            if match is None:
+                raise ValueError(f"unquoted container_version: {line.group(1).decode().strip()}")
+            return match.group(1).decode()
+
+
+def _read_version(versions_file: Path) -> str | None:
+    """Return the cached container_version for *versions_file*, or None if missing."""
+    if not versions_file.exists():
+        return None
+    return load_cached(versions_file, _parse_versions_log)
 
 
 def get_algorithms(config: dict) -> list[dict[str, str]]:
@@ -11,44 +50,46 @@ def get_algorithms(config: dict) -> list[dict[str, str]]:
     Filters out excluded algorithms from config.
     Returns list of dicts with 'name' and 'version' keys.
     """
-    repo_path = Path(__file__).parent.parent / config["denovo_benchmarks"]["local_path"]
+    repo_path = RUNNER_DIR / config["denovo_benchmarks"]["local_path"]
     algorithms_path = repo_path / "algorithms"
 
     excluded = set(config.get("excluded_algorithms", []))
-    algorithms = []
 
-    for algo_dir in algorithms_path.iterdir():
-        if not algo_dir.is_dir() or algo_dir.name.startswith("."):
-            continue
+    # scandir reuses the directory entry's file type, avoiding a stat() per entry
+    with os.scandir(algorithms_path) as entries:
+        candidates = [
+            (entry.name, Path(entry.path) / "versions.log")
+            for entry in entries
+            if entry.is_dir() and not entry.name.startswith(".") and entry.name not in excluded
+        ]
 
-        # Skip excluded algorithms
-        if algo_dir.name in excluded:
-            continue
+    # Reads are I/O-bound (often on a network filesystem), so overlap them; cache
+    # misses are written back in one index write once every file has been read
+    with deferred_writes(), ThreadPoolExecutor(max_workers=16) as executor:
+        futures = [
+            (name, versions_file, executor.submit(_read_version, versions_file))
+            for name, versions_file in candidates
+        ]
 
-        versions_file = algo_dir / "versions.log"
-        if not versions_file.exists():
-            continue
-
-        # Parse versions.log to get latest version
+    # Report from this thread: workers do not carry the Prefect run context for print capture
+    algorithms = []
+    for name, versions_file, future in futures:
         try:
-            with open(versions_file, "r") as f:
-                content = f.read()
-                # Simple parsing - get first container_version
-                for line in content.split("\n"):
-                    if "container_version:" in line:
-                        version = line.split('"')[1]
-                        algorithms.append({"name": algo_dir.name, "version": version})
-                        break
+            version = future.result()
         except Exception as e:
             print_warning(f"Could not parse {versions_file}: {e}")
             continue
 
+        if version is not None:
+            algorithms.append({"name": name, "version": version})
+
     return algorithms
 
 
 def display_algorithms(algorithms: list[dict[str, str]]):
     """Display discovered algorithms."""
-    print_header("Discovering Algorithms")
-    print_success(f"Found {len(algorithms)} algorithm(s) with versions:")
-    for algo in algorithms:
-        print(f"    • {algo['name']} (version: {algo['version']})")
+    with DisplayBuffer() as out:
+        print_header("Discovering Algorithms")
+        print_success(f"Found {len(algorithms)} algorithm(s) with versions:")
+        for algo in algorithms:
+            out.emit(f"    • {algo['name']} (version: {algo['version']})")
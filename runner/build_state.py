@@ -1,31 +1,106 @@
 """Container build state tracking."""
 
-import json
+import os
 import subprocess
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+from .alexandria import container_paths
+from .paths import RUNNER_DIR
+from .remote_fs import remote_test_many
+
+# orjson is optional (pip install .[fast]); both paths read and write the same JSON
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    import json
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+# sacct states that mean the job ended without succeeding
+FAILED_SLURM_STATES = ["FAILED", "CANCELLED", "TIMEOUT", "NODE_FAIL", "OUT_OF_MEMORY"]
+
+# Build log markers used when Slurm accounting is unavailable
+FAILURE_LOG_INDICATORS = [
+    "FATAL:",
+    "exit status 1",
+    "✗ Container build failed",
+    "✗ Transfer to Alexandria failed",
+    "Error:",
+    "FAILED",
+]
+SUCCESS_LOG_INDICATORS = [
+    "Container Build Complete!",
+    "✓ Container transferred to Alexandria",
+]
+
 
 class BuildState:
     """Track container build states."""
 
     def __init__(self, state_file: Path = None):
         if state_file is None:
-            state_file = Path(__file__).parent.parent / "build_state.json"
+            state_file = RUNNER_DIR / "build_state.json"
         self.state_file = state_file
         self.states = self._load()
+        self._dirty = False
+        self._deferred = 0
+        # Build tasks share one BuildState across threads; serialize file writes
+        self._write_lock = threading.Lock()
+        # Bumped whenever a build job is added, so update_from_slurm knows to re-query
+        self._generation = 0
+        self._slurm_updates: tuple[tuple[int, bool], list[str]] | None = None
 
     def _load(self) -> dict:
         """Load build states from JSON file."""
         if not self.state_file.exists():
             return {}
-        with open(self.state_file, "r") as f:
-            return json.load(f)
+        return _loads(self.state_file.read_bytes())
 
     def _save(self):
-        """Save build states to JSON file."""
-        with open(self.state_file, "w") as f:
-            json.dump(self.states, f, indent=2)
+        """Record that states changed, writing them out unless saves are deferred."""
+        self._dirty = True
+        if not self._deferred:
+            self.flush()
+
+    def flush(self):
+        """Write build states to JSON file if they changed since the last write.
+
+        The file is written to a temporary sibling and renamed into place, so an
+        interrupted run never leaves a truncated ``build_state.json`` behind.
+        """
+        with self._write_lock:
+            if not self._dirty:
+                return
+            tmp_file = self.state_file.with_suffix(".tmp")
+            tmp_file.write_bytes(_dumps(self.states))
+            os.replace(tmp_file, self.state_file)
+            self._dirty = False
+
+    @contextmanager
+    def deferred_saves(self):
+        """Collapse all state changes inside the block into a single write on exit."""
+        self._deferred += 1
+        try:
+            yield self
+        finally:
+            self._deferred -= 1
+            if not self._deferred:
+                self.flush()
 
     def get_key(self, algo_name: str, version: str) -> str:
         """Get state key for algorithm and version."""
@@ -40,6 +115,7 @@ class BuildState:
             "started_at": datetime.now().isoformat(),
             "updated_at": datetime.now().isoformat(),
         }
+        self._generation += 1
         self._save()
 
     def mark_completed(self, algo_name: str, version: str):
@@ -65,6 +141,10 @@ class BuildState:
         key = self.get_key(algo_name, version)
         return self.states.get(key)
 
+    def has_building(self) -> bool:
+        """Return True if any build is currently marked as building."""
+        return any(state["status"] == "building" for state in self.states.values())
+
     def clear_status(self, algo_name: str, version: str):
         """Clear build status for algorithm (useful for retrying after fixing errors)."""
         key = self.get_key(algo_name, version)
@@ -77,141 +157,160 @@ class BuildState:
         Check Slurm job status.
         Returns: 'running', 'completed', 'failed', or 'unknown'
         """
+        return self.check_job_statuses([job_id])[job_id]
+
+    def check_job_statuses(self, job_ids: list[str]) -> dict[str, str]:
+        """
+        Check the Slurm status of several jobs with one squeue and at most one sacct call.
+        Returns dict mapping each job ID to 'running', 'completed', 'failed', or 'unknown'.
+        """
+        if not job_ids:
+            return {}
+
+        statuses = {}
+        job_list = ",".join(job_ids)
+
+        # -r lists pending array tasks one per line ("123_4") instead of "123_[4-7]"
         result = subprocess.run(
-            ["squeue", "-j", job_id, "-h", "-o", "%T"],
+            ["squeue", "-j", job_list, "-h", "-o", "%i %T", "-r"],
             capture_output=True,
             text=True,
         )
 
-        if result.returncode != 0 or not result.stdout.strip():
-            # Job not in queue, check sacct for completion
-            result = subprocess.run(
-                ["sacct", "-j", job_id, "-n", "-o", "State", "--parsable2"],
-                capture_output=True,
-                text=True,
-            )
+        if result.returncode == 0:
+            for line in result.stdout.splitlines():
+                fields = line.split()
+                if fields and fields[0] in job_ids:
+                    # Job still in queue
+                    statuses[fields[0]] = "running"
+
+        finished = [job_id for job_id in job_ids if job_id not in statuses]
+        if not finished:
+            return statuses
+
+        # Jobs not in queue, check sacct for completion
+        result = subprocess.run(
+            ["sacct", "-j", ",".join(finished), "-n", "-o", "JobID,State", "--parsable2"],
+            capture_output=True,
+            text=True,
+        )
 
-            if result.returncode == 0 and result.stdout.strip():
-                state = result.stdout.strip().split("\n")[0].upper()
+        if result.returncode == 0:
+            for line in result.stdout.splitlines():
+                # Step lines (e.g. "123.batch") never match; the job's own line comes first
+                job_id, _, state = line.partition("|")
+                if job_id not in finished or job_id in statuses:
+                    continue
+                state = state.upper()
                 if "COMPLETED" in state:
-                    return "completed"
-                elif any(
-                    x in state
-                    for x in [
-                        "FAILED",
-                        "CANCELLED",
-                        "TIMEOUT",
-                        "NODE_FAIL",
-                        "OUT_OF_MEMORY",
-                    ]
-                ):
-                    return "failed"
-
-            # Fallback: sacct unavailable or failed, check log files
-            # This handles systems with accounting disabled
-            return self._check_job_logs(job_id)
-
-        # Job still in queue
-        return "running"
+                    statuses[job_id] = "completed"
+                elif any(x in state for x in FAILED_SLURM_STATES):
+                    statuses[job_id] = "failed"
+
+        # Fallback: sacct unavailable or inconclusive, check log files
+        # This handles systems with accounting disabled
+        for job_id in finished:
+            if job_id not in statuses:
+                statuses[job_id] = self._check_job_logs(job_id)
+
+        return statuses
 
     def _check_job_logs(self, job_id: str) -> str:
         """
         Fallback method to check job status from log files.
         Used when sacct is unavailable (accounting disabled).
         """
-        runner_dir = Path(__file__).parent.parent
-        logs_dir = runner_dir / "logs"
+        logs_dir = RUNNER_DIR / "logs"
 
-        # Find error log for this job
-        error_logs = list(logs_dir.glob(f"build_*_{job_id}.err"))
+        # Find error log for this job. Array wrappers from before they were renamed
+        # to array_build_* also match the pattern; their logs are always empty.
+        error_logs = [
+            log
+            for log in logs_dir.glob(f"build_*_{job_id}.err")
+            if not log.name.startswith("build_array_")
+        ]
 
         if not error_logs:
             return "unknown"
 
         error_log = error_logs[0]
 
-        try:
-            with open(error_log, "r") as f:
-                content = f.read()
-
-            # Check for failure indicators
-            failure_indicators = [
-                "FATAL:",
-                "exit status 1",
-                "✗ Container build failed",
-                "✗ Transfer to Alexandria failed",
-                "Error:",
-                "FAILED",
-            ]
-
-            if any(indicator in content for indicator in failure_indicators):
-                return "failed"
-
-            # Check for success indicators
-            success_indicators = [
-                "Container Build Complete!",
-                "✓ Container transferred to Alexandria",
-            ]
-
-            if any(indicator in content for indicator in success_indicators):
-                return "completed"
-
-        except Exception:
-            pass
+        # grep stops at the first match, so large logs are never read in full
+        if self._log_contains(error_log, FAILURE_LOG_INDICATORS):
+            return "failed"
+
+        if self._log_contains(error_log, SUCCESS_LOG_INDICATORS):
+            return "completed"
 
         return "unknown"
 
+    @staticmethod
+    def _log_contains(log_file: Path, indicators: list[str]) -> bool:
+        """Return True if *log_file* contains any of the fixed strings *indicators*."""
+        patterns = [arg for indicator in indicators for arg in ("-e", indicator)]
+        try:
+            result = subprocess.run(
+                ["grep", "-F", "-q", *patterns, str(log_file)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return False
+        return result.returncode == 0
+
     def update_from_slurm(self, config: dict = None):
         """
         Update build states by checking Slurm for running jobs.
         If config provided, also verify container exists on Alexandria when job completes.
+
+        Repeated calls return the previous updates without querying Slurm again
+        until a new build is marked as building.
         """
+        cache_key = (self._generation, config is not None)
+        if self._slurm_updates is not None and self._slurm_updates[0] == cache_key:
+            return list(self._slurm_updates[1])
+
         updates = []
-        for key, state in self.states.items():
-            if state["status"] == "building":
-                job_id = state.get("job_id")
-                if job_id:
-                    job_status = self.check_job_status(job_id)
-                    algo_name, version = key.split("@")
-
-                    if job_status == "completed":
-                        # Verify container exists on Alexandria if config provided
-                        if config:
-                            import subprocess
-
-                            host = config["alexandria"]["host"]
-                            containers_path = config["alexandria"]["containers_path"]
-                            container_path = (
-                                f"{containers_path}/{algo_name}/{version}/container.sif"
-                            )
-
-                            result = subprocess.run(
-                                [
-                                    "ssh",
-                                    host,
-                                    f'test -f {container_path} && echo "exists" || echo "missing"',
-                                ],
-                                capture_output=True,
-                                text=True,
-                            )
-
-                            if result.stdout.strip() == "exists":
-                                self.mark_completed(algo_name, version)
-                                updates.append(f"✓ {algo_name} ({version}) build completed")
-                            else:
-                                self.mark_failed(
-                                    algo_name,
-                                    version,
-                                    "Slurm job completed but container not found on Alexandria",
-                                )
-                                updates.append(
-                                    f"✗ {algo_name} ({version}) build failed - container not found"
-                                )
-                        else:
-                            self.mark_completed(algo_name, version)
-                            updates.append(f"✓ {algo_name} ({version}) build completed")
-                    elif job_status == "failed":
-                        self.mark_failed(algo_name, version, "Slurm job failed")
-                        updates.append(f"✗ {algo_name} ({version}) build failed")
-
-        return updates
+        building = [
+            (key, state["job_id"])
+            for key, state in self.states.items()
+            if state["status"] == "building" and state.get("job_id")
+        ]
+
+        # One squeue (and at most one sacct) for all jobs instead of one per job
+        job_statuses = self.check_job_statuses([job_id for _, job_id in building])
+
+        # Verify all completed containers exist on Alexandria in one SSH session
+        container_found = {}
+        completed = [key for key, job_id in building if job_statuses[job_id] == "completed"]
+        if config and completed:
+            host = config["alexandria"]["host"]
+            paths = container_paths(config, [tuple(key.split("@")) for key in completed])
+            found = remote_test_many(host, [("-f", path) for path in paths.values()])
+            container_found = dict(zip(completed, found))
+
+        # Write the state file once for all updates rather than once per job
+        with self.deferred_saves():
+            for key, job_id in building:
+                job_status = job_statuses[job_id]
+                algo_name, version = key.split("@")
+
+                if job_status == "completed":
+                    if config and not container_found[key]:
+                        self.mark_failed(
+                            algo_name,
+                            version,
+                            "Slurm job completed but container not found on Alexandria",
+                        )
+                        updates.append(
+                            f"✗ {algo_name} ({version}) build failed - container not found"
+                        )
+                    else:
+                        self.mark_completed(algo_name, version)
+                        updates.append(f"✓ {algo_name} ({version}) build completed")
+                elif job_status == "failed":
+                    self.mark_failed(algo_name, version, "Slurm job failed")
+                    updates.append(f"✗ {algo_name} ({version}) build failed")
+
+        self._slurm_updates = (cache_key, updates)
+        return list(updates)
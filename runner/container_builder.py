@@ -1,12 +1,15 @@
 """Container building operations."""
 
 import os
+import shlex
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from .build_state import BuildState
 from .display import print_error, print_header, print_info, print_step, print_success, print_warning
 from .job_waiter import wait_for_job_completion
+from .paths import RUNNER_DIR
 
 
 def get_runner_dir() -> Path:
@@ -20,7 +23,7 @@ def get_runner_dir() -> Path:
 
     Solution: Detect container execution and return host path.
     """
-    runner_dir = Path(__file__).parent.parent
+    runner_dir = RUNNER_DIR
 
     # Check if running in Apptainer/Singularity container
     if os.environ.get("APPTAINER_NAME") or os.environ.get("SINGULARITY_NAME"):
@@ -31,6 +34,13 @@ def get_runner_dir() -> Path:
     return runner_dir
 
 
+@lru_cache(maxsize=8)
+def read_template(template_path: Path) -> str:
+    """Read a Slurm job template, caching its text for the rest of the process."""
+    with open(template_path, "r") as f:
+        return f.read()
+
+
 def get_container_def_path(
     config: dict, algo_name: str, version: str, benchmarks_dir: Path
 ) -> Path:
@@ -54,16 +64,25 @@ def get_container_def_path(
     return original_path
 
 
-def submit_build_job(
+def _build_resources(slurm_resources: dict) -> dict:
+    """Map Slurm resource settings to build template placeholders."""
+    return {
+        "PARTITION": slurm_resources.get("partition", "one_hour"),
+        "CPUS": str(slurm_resources.get("cpus", 4)),
+        "MEMORY": slurm_resources.get("memory", "16G"),
+        "TIME": slurm_resources.get("time", "01:00:00"),
+    }
+
+
+def _write_build_script(
     config: dict,
     algo_name: str,
     version: str,
-    build_state: BuildState,
     slurm_resources: dict | None = None,
-) -> str | None:
+) -> Path | None:
     """
-    Submit a Slurm job to build a container.
-    Returns job ID if successful, None otherwise.
+    Render the build job script for one container into slurm_jobs/.
+    Returns the script path, or None if the container definition is missing.
     """
     runner_dir = get_runner_dir()
     benchmarks_dir = runner_dir / config["denovo_benchmarks"]["local_path"]
@@ -86,16 +105,10 @@ def submit_build_job(
     if slurm_resources is None:
         slurm_resources = config.get("slurm", {})
 
-    resources = {
-        "PARTITION": slurm_resources.get("partition", "one_hour"),
-        "CPUS": str(slurm_resources.get("cpus", 4)),
-        "MEMORY": slurm_resources.get("memory", "16G"),
-        "TIME": slurm_resources.get("time", "01:00:00"),
-    }
+    resources = _build_resources(slurm_resources)
 
     # Read template and substitute variables
-    with open(template_path, "r") as f:
-        template = f.read()
+    template = read_template(template_path)
 
     job_script = template.format(
         ALGO_NAME=algo_name,
@@ -112,20 +125,18 @@ def submit_build_job(
     with open(job_script_path, "w") as f:
         f.write(job_script)
 
-    # Submit job
+    return job_script_path
+
+
+def _sbatch(job_script_path: Path) -> str | None:
+    """Submit a job script with sbatch. Returns the job ID, or None on failure."""
     result = subprocess.run(["sbatch", str(job_script_path)], capture_output=True, text=True)
 
     if result.returncode == 0:
         # Parse job ID from sbatch output
         output = result.stdout.strip()
         if "Submitted batch job" in output:
-            job_id = output.split()[-1]
-            print_success(f"Build job submitted: {job_id}")
-
-            # Mark as building in state
-            build_state.mark_building(algo_name, version, job_id)
-
-            return job_id
+            return output.split()[-1]
     else:
         error_msg = result.stderr.strip()
         if "Unable to contact slurm controller" in error_msg:
@@ -133,8 +144,93 @@ def submit_build_job(
             print_error("Please check cluster status or contact administrators")
         else:
             print_error(f"Failed to submit build job: {error_msg}")
+    return None
+
+
+def submit_build_job(
+    config: dict,
+    algo_name: str,
+    version: str,
+    build_state: BuildState,
+    slurm_resources: dict | None = None,
+) -> str | None:
+    """
+    Submit a Slurm job to build a container.
+    Returns job ID if successful, None otherwise.
+    """
+    job_script_path = _write_build_script(config, algo_name, version, slurm_resources)
+    if job_script_path is None:
         return None
 
+    job_id = _sbatch(job_script_path)
+    if job_id:
+        print_success(f"Build job submitted: {job_id}")
+
+        # Mark as building in state
+        build_state.mark_building(algo_name, version, job_id)
+
+    return job_id
+
+
+def submit_build_array(
+    config: dict,
+    builds: list[tuple[str, str]],
+    build_state: BuildState,
+    slurm_resources: dict | None = None,
+) -> dict[tuple[str, str], str]:
+    """
+    Submit several container builds as a single Slurm array job.
+    Each array task runs the regular per-container build script, logging to
+    build_<algo>_<version>_<job_id>.out/.err with job_id "<array_id>_<index>".
+    Returns dict mapping (algo_name, version) to its array task job ID.
+    Builds missing from the result (bad definition, failed submission) were not submitted.
+    """
+    runner_dir = get_runner_dir()
+
+    # Render the per-container scripts; skip builds without a container definition
+    scripts = {}
+    for algo_name, version in builds:
+        job_script_path = _write_build_script(config, algo_name, version, slurm_resources)
+        if job_script_path is not None:
+            scripts[(algo_name, version)] = job_script_path
+
+    if not scripts:
+        return {}
+
+    if slurm_resources is None:
+        slurm_resources = config.get("slurm", {})
+
+    logs_dir = runner_dir / "logs"
+    template = read_template(runner_dir / "templates" / "build_container_array.slurm.sh")
+    array_script = template.format(
+        RUNNER_DIR=str(runner_dir),
+        LAST_INDEX=len(scripts) - 1,
+        BUILD_SCRIPTS=shlex.join(str(path) for path in scripts.values()),
+        LOG_PREFIXES=shlex.join(
+            str(logs_dir / f"build_{algo_name}_{version}") for algo_name, version in scripts
+        ),
+        **_build_resources(slurm_resources),
+    )
+
+    array_script_path = runner_dir / "slurm_jobs" / "build_array.sh"
+    with open(array_script_path, "w") as f:
+        f.write(array_script)
+
+    array_id = _sbatch(array_script_path)
+    if not array_id:
+        return {}
+
+    print_success(f"Build array job submitted: {array_id} ({len(scripts)} containers)")
+
+    job_ids = {}
+    with build_state.deferred_saves():
+        for index, (algo_name, version) in enumerate(scripts):
+            job_id = f"{array_id}_{index}"
+            build_state.mark_building(algo_name, version, job_id)
+            job_ids[(algo_name, version)] = job_id
+
+    return job_ids
+
 
 def submit_and_wait_for_build(
     config: dict,
@@ -142,14 +238,17 @@ def submit_and_wait_for_build(
     version: str,
     build_state: BuildState,
     slurm_resources: dict | None = None,
+    job_id: str | None = None,
 ) -> tuple[bool, str | None]:
     """
     Submit a container build job and wait for it to complete.
+    Pass job_id to wait on a build already submitted (e.g. by submit_build_array).
 
     Returns:
         (success, job_id) tuple
     """
-    job_id = submit_build_job(config, algo_name, version, build_state, slurm_resources)
+    if job_id is None:
+        job_id = submit_build_job(config, algo_name, version, build_state, slurm_resources)
 
     if not job_id:
         return False, None
@@ -190,48 +289,55 @@ def check_and_display_builds(
 
     build_state = BuildState()
 
-    # Update states from Slurm
-    print_step("Checking ongoing builds...")
-    updates = build_state.update_from_slurm(config)
+    # Update states from Slurm (nothing to ask Slurm about if no build is running)
+    if build_state.has_building():
+        print_step("Checking ongoing builds...")
+        updates = build_state.update_from_slurm(config)
 
-    # Display any status updates
-    if updates:
-        print()
-        for update in updates:
-            print(f"  {update}")
-        print()
+        # Display any status updates
+        if updates:
+            print()
+            for update in updates:
+                print(f"  {update}")
+            print()
 
     # Reconcile build state with Alexandria reality
     # If container exists but state says building/failed, mark as completed
     # If container missing but state says completed, clear the state for rebuild
-    for algo in algorithms:
-        algo_name = algo["name"]
-        version = algo["version"]
-        container_exists = container_status.get(algo_name, False)
-        build_status = build_state.get_status(algo_name, version)
-
-        if container_exists and build_status and build_status["status"] != "completed":
-            print_step(
-                f"Reconciling: {algo_name} ({version}) exists, state was '{build_status['status']}'"
-            )
-            build_state.mark_completed(algo_name, version)
-        elif not container_exists and build_status and build_status["status"] == "completed":
-            print_step(f"{algo_name} ({version}) completed but container missing - will rebuild")
-            build_state.clear_status(algo_name, version)
+    with build_state.deferred_saves():
+        for algo in algorithms:
+            algo_name = algo["name"]
+            version = algo["version"]
+            container_exists = container_status.get(algo_name, False)
+            build_status = build_state.get_status(algo_name, version)
+
+            if container_exists and build_status and build_status["status"] != "completed":
+                print_step(
+                    f"Reconciling: {algo_name} ({version}) exists, "
+                    f"state was '{build_status['status']}'"
+                )
+                build_state.mark_completed(algo_name, version)
+            elif not container_exists and build_status and build_status["status"] == "completed":
+                print_step(
+                    f"{algo_name} ({version}) completed but container missing - will rebuild"
+                )
+                build_state.clear_status(algo_name, version)
+
+    # Only algorithms without a container on Alexandria need a closer look
+    pending = [algo for algo in algorithms if not container_status.get(algo["name"], False)]
+    if not pending:
+        print_success("All containers are built or building!")
+        return [], build_state
 
     # Check each algorithm
     needs_building = []
     currently_building = []
     has_errors = []
 
-    for algo in algorithms:
+    for algo in pending:
         algo_name = algo["name"]
         version = algo["version"]
 
-        # Skip if container exists on Alexandria
-        if container_status.get(algo_name, False):
-            continue
-
         # Check build state
         status = build_state.get_status(algo_name, version)
 
@@ -268,10 +374,9 @@ def check_and_display_builds(
         print_step(f"{len(needs_building)} container(s) need to be built")
 
         # Check for overrides
-        runner_dir = Path(__file__).parent.parent
         for algo_name, version in needs_building:
             override_path = (
-                runner_dir / "container_overrides" / algo_name / version / "container.def"
+                RUNNER_DIR / "container_overrides" / algo_name / version / "container.def"
             )
             if override_path.exists():
                 print(f"    📝 {algo_name} ({version}) [has override]")
@@ -284,14 +389,18 @@ def check_and_display_builds(
     return needs_building, build_state
 
 
-def check_and_build_evaluation_container(config: dict, evaluation_exists: bool) -> bool:
+def check_and_build_evaluation_container(
+    config: dict, evaluation_exists: bool, build_state: BuildState = None
+) -> bool:
     """
     Check and build evaluation container if needed.
+    Pass the BuildState from check_and_display_builds to reuse its Slurm update.
     Returns True if evaluation container needs building, False otherwise.
     """
     print_header("Evaluation Container Status")
 
-    build_state = BuildState()
+    if build_state is None:
+        build_state = BuildState()
 
     # Update state from Slurm
     print_step("Checking evaluation container status...")
@@ -6,7 +6,8 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
-from .container_builder import get_runner_dir
+from .container_builder import get_runner_dir, read_template
+from .remote_fs import ssh_run
 
 
 class DatasetManager:
@@ -223,8 +224,9 @@ def get_dataset_size_on_alexandria(config: dict, dataset_name: str) -> int:
     datasets_path = config["alexandria"]["datasets_path"]
     dataset_path = f"{datasets_path}/{dataset_name}"
 
-    result = subprocess.run(
-        ["ssh", host, f"du -sb {dataset_path} 2>/dev/null || echo '0'"],
+    result = ssh_run(
+        host,
+        f"du -sb {dataset_path} 2>/dev/null || echo '0'",
         capture_output=True,
         text=True,
     )
@@ -300,8 +302,7 @@ def submit_pull_job(config: dict, dataset_name: str, dataset_manager: DatasetMan
     }
 
     # Read template and substitute variables
-    with open(template_path, "r") as f:
-        template = f.read()
+    template = read_template(template_path)
 
     datasets_dir = runner_dir / config["local_datasets"]["path"]
     datasets_dir.mkdir(exist_ok=True)
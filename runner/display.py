@@ -1,42 +1,98 @@
-"""Display utilities for orchestration system."""
+"""Display utilities for orchestration system.
+
+All output goes through print(): flows run with ``log_prints=True``, and Prefect
+only captures print() calls, so writing to ``sys.stdout`` (or its byte buffer)
+directly would drop these messages from the run logs. Use DisplayBuffer to
+batch several lines into one write.
+"""
+
+import threading
+
+_local = threading.local()
+
+_BAR = "=" * 70
+
+_BANNER = "\n".join(
+    [
+        "\n" + "█" * 70,
+        "█" + " " * 68 + "█",
+        "█" + "  Denovo Benchmarks Orchestration System".center(68) + "█",
+        "█" + " " * 68 + "█",
+        "█" * 70 + "\n",
+    ]
+)
+
+
+class DisplayBuffer:
+    """
+    Collect display output and emit it as one write when the block exits.
+
+    While a buffer is active on the current thread, the print_* helpers and
+    :meth:`emit` append to it instead of printing. Output still goes through
+    print() on exit, so Prefect's log_prints capture sees it. Nested buffers
+    fold into the outermost one.
+    """
+
+    def __enter__(self) -> "DisplayBuffer":
+        self.buf: list[str] = []
+        self._outer = getattr(_local, "buffer", None)
+        _local.buffer = self
+        return self
+
+    def emit(self, text: str):
+        """Add a line of output to the buffer."""
+        self.buf.append(text)
+
+    def __exit__(self, *exc_info):
+        _local.buffer = self._outer
+        if not self.buf:
+            return
+        if self._outer is not None:
+            self._outer.buf.extend(self.buf)
+        else:
+            print("\n".join(self.buf), flush=True)
+
+
+def _emit(text: str):
+    """Print *text*, or add it to the current thread's DisplayBuffer if one is active."""
+    buffer = getattr(_local, "buffer", None)
+    if buffer is not None:
+        buffer.emit(text)
+    else:
+        print(text)
 
 
 def print_header(text: str):
     """Print a nice header."""
-    print("\n" + "=" * 70)
-    print(f"  {text}")
-    print("=" * 70 + "\n")
+    # One print so the header stays a single write (and a single Prefect log record)
+    _emit(f"\n{_BAR}\n  {text}\n{_BAR}\n")
 
 
 def print_banner():
     """Print the main banner."""
-    print("\n" + "█" * 70)
-    print("█" + " " * 68 + "█")
-    print("█" + "  Denovo Benchmarks Orchestration System".center(68) + "█")
-    print("█" + " " * 68 + "█")
-    print("█" * 70 + "\n")
+    _emit(_BANNER)
 
 
 def print_step(text: str):
     """Print a step indicator."""
-    print(f"➜ {text}")
+    _emit(f"➜ {text}")
 
 
 def print_success(text: str):
     """Print success message."""
-    print(f"  ✓ {text}")
+    _emit(f"  ✓ {text}")
 
 
 def print_info(text: str):
     """Print info message."""
-    print(f"  ℹ {text}")
+    _emit(f"  ℹ {text}")
 
 
 def print_warning(text: str):
     """Print warning message."""
-    print(f"  ⚠ {text}")
+    _emit(f"  ⚠ {text}")
 
 
 def print_error(text: str):
     """Print error message."""
-    print(f"  ✗ {text}")
+    _emit(f"  ✗ {text}")
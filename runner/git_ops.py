@@ -1,84 +1,315 @@
 """Git operations for repository management."""
 
+import contextvars
+import os
+import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
-from .display import print_header, print_step, print_success, print_warning
+from .display import (
+    DisplayBuffer,
+    print_error,
+    print_header,
+    print_step,
+    print_success,
+    print_warning,
+)
+from .paths import RUNNER_DIR
+
+# Absolute executable paths let CPython start children with posix_spawn (vfork)
+# instead of fork+exec, which avoids copying the parent's page tables.
+_GIT = shutil.which("git") or "git"
+_SH = shutil.which("sh") or "sh"
+
+# Seconds after a fetch during which re-runs trust the fetched refs instead of
+# asking the remote again (``fetch_ttl_sec`` in a repository's config section)
+DEFAULT_FETCH_TTL_SEC = 60
+
+
+# Never block an unattended run on a credential prompt, and let read-only
+# commands skip the optional index refresh (and its index.lock)
+_GIT_ENV = {"GIT_TERMINAL_PROMPT": "0", "GIT_OPTIONAL_LOCKS": "0"}
+
+
+def _run(argv: list[str], **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run with the options that keep it on the posix_spawn fast path.
+
+    close_fds=False is safe here: Python creates descriptors non-inheritable, so
+    the child still only receives its standard streams. The git environment
+    overrides in _GIT_ENV apply to every git the child runs.
+    """
+    return subprocess.run(argv, close_fds=False, env={**os.environ, **_GIT_ENV}, **kwargs)
+
 
 # ---------------------------------------------------------------------------
 # Primitives — thin wrappers around git CLI network operations.
 # These are the only functions that touch the network / remote; replace them
 # in tests to keep the pipeline logic exercised without real git remotes.
+# Only exit codes (and the status script's one-line count) are used, so git's
+# progress and diagnostics go to /dev/null rather than being buffered in memory.
 # ---------------------------------------------------------------------------
 
 
 def git_clone(url: str, branch: str, path: Path) -> bool:
-    """Clone *url* (branch *branch*) into *path*. Return True on success."""
-    result = subprocess.run(
-        ["git", "clone", "-b", branch, url, str(path)],
-        capture_output=True,
-        text=True,
+    """Clone the tip of *url* (branch *branch*) into *path*. Return True on success.
+
+    The clone is shallow and blobless: the runner only reads the checked-out
+    tree, so history and blobs outside it are never downloaded. Every remote
+    branch is still tracked, so a later change of the configured branch can be
+    checked out.
+    """
+    result = _run(
+        [
+            _GIT,
+            "-c",
+            "protocol.version=2",
+            "clone",
+            "--depth=1",
+            "--no-single-branch",
+            "--filter=blob:none",
+            "-b",
+            branch,
+            url,
+            str(path),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     return result.returncode == 0
 
 
-def git_fetch(path: Path) -> None:
-    """Fetch from origin for the repo at *path* (no-op if already up to date)."""
-    subprocess.run(["git", "-C", str(path), "fetch"], capture_output=True)
+# Prints how far the local branch is behind its upstream. A cheap ls-remote
+# probe comes first: when the remote tip equals the local branch tip ($3) there
+# is nothing to download, so the fetch is skipped. With $4 set, the last fetch
+# is recent enough and the count is taken from the existing origin/B without
+# touching the network. The commit graph is only walked when the two tips
+# differ. Compares refs/heads/B rather than HEAD so the count
+# stays valid after check_or_clone_repo switches to the expected branch.
+_GIT_STATUS_SCRIPT = """
+if [ -z "$4" ]; then
+    remote_tip=$(git -C "$1" ls-remote origin "refs/heads/$2" 2>/dev/null | cut -f1)
+    if [ -n "$remote_tip" ] && [ "$remote_tip" = "$3" ]; then
+        echo 0
+        exit 0
+    fi
+    git -C "$1" fetch --quiet
+fi
+if [ "$(git -C "$1" rev-parse --verify --quiet "refs/remotes/origin/$2")" = "$3" ]; then
+    echo 0
+    exit 0
+fi
+git -C "$1" rev-list --count "refs/heads/$2..origin/$2" 2>/dev/null || echo 0
+"""
+
 
+def git_status(path: Path, branch: str, fetch_ttl: float = 0) -> tuple[str, int]:
+    """Return (current_branch, commits behind origin/*branch*) for the repo at *path*.
 
-def git_count_behind(path: Path, branch: str) -> int:
-    """Return number of commits the local HEAD is behind *origin/branch*."""
-    result = subprocess.run(
-        ["git", "-C", str(path), "rev-list", "--count", f"HEAD..origin/{branch}"],
-        capture_output=True,
-        text=True,
+    The current branch and local tip are read from ``.git`` directly; the remote
+    probe, fetch (only when the remote tip moved) and behind-count run in one
+    shell process. If the last fetch is less than *fetch_ttl* seconds old, the
+    network is skipped and the count uses the already-fetched origin/*branch*.
+    """
+    git_dir = _git_dir(path)
+    if git_dir is None:
+        return "", 0
+    current_branch = _read_branch(git_dir)
+    local_tip = _read_ref(git_dir, f"refs/heads/{branch}") or ""
+    recently_fetched = "1" if _fetched_within(git_dir, fetch_ttl) else ""
+    if recently_fetched and local_tip == _read_ref(git_dir, f"refs/remotes/origin/{branch}"):
+        # Nothing new since the last fetch: no subprocess needed at all
+        return current_branch, 0
+
+    result = _run(
+        [_SH, "-c", _GIT_STATUS_SCRIPT, "sh", str(path), branch, local_tip, recently_fetched],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
     )
+    # int() parses the ASCII count straight from bytes; no text decode needed
     try:
-        return int(result.stdout.strip())
-    except ValueError:
-        return 0
+        commits_behind = int(result.stdout.split()[0])
+    except (IndexError, ValueError):
+        commits_behind = 0
+    return current_branch, commits_behind
 
 
 def git_pull_rebase(path: Path) -> bool:
     """Pull with rebase for the repo at *path*. Return True on success."""
-    result = subprocess.run(
-        ["git", "-C", str(path), "pull", "--rebase"],
-        capture_output=True,
-        text=True,
+    result = _run(
+        [_GIT, "-C", str(path), "pull", "--rebase"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     return result.returncode == 0
 
 
 def git_get_branch(path: Path) -> str:
-    """Return the current branch name for the repo at *path*."""
-    result = subprocess.run(
-        ["git", "-C", str(path), "rev-parse", "--abbrev-ref", "HEAD"],
-        capture_output=True,
-        text=True,
-    )
-    return result.stdout.strip()
+    """Return the current branch name for the repo at *path* ("HEAD" if detached)."""
+    git_dir = _git_dir(path)
+    return _read_branch(git_dir) if git_dir is not None else ""
+
+
+def git_checkout(path: Path, branch: str) -> bool:
+    """Check out *branch* in the repo at *path*. Return True on success."""
+    result = _run([_GIT, "-C", str(path), "checkout", branch])
+    return result.returncode == 0
+
+
+# ---------------------------------------------------------------------------
+# Local ref reads — parse .git/HEAD and refs in-process instead of spawning
+# git rev-parse for each lookup.
+# ---------------------------------------------------------------------------
+
+
+def _git_dir(path: Path) -> Path | None:
+    """Return the git directory for the work tree at *path*, or None if there is none."""
+    dot_git = path / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        # Linked worktrees and submodules use a ".git" file pointing elsewhere
+        content = dot_git.read_text().strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    return (path / content.removeprefix("gitdir:").strip()).resolve()
+
+
+def _refs_dir(git_dir: Path) -> Path:
+    """Return the directory holding shared refs (differs from *git_dir* in worktrees)."""
+    try:
+        return (git_dir / (git_dir / "commondir").read_text().strip()).resolve()
+    except OSError:
+        return git_dir
+
+
+def _read_branch(git_dir: Path) -> str:
+    """Return the branch HEAD points at, "HEAD" when detached, or "" if unreadable."""
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return ""
+    if head.startswith("ref: "):
+        return head.removeprefix("ref: ").removeprefix("refs/heads/")
+    return "HEAD"
+
+
+def _fetched_within(git_dir: Path, seconds: float) -> bool:
+    """Return True if FETCH_HEAD was written less than *seconds* ago."""
+    if seconds <= 0:
+        return False
+    for directory in (git_dir, _refs_dir(git_dir)):
+        try:
+            age = time.time() - (directory / "FETCH_HEAD").stat().st_mtime
+        except OSError:
+            continue
+        return age < seconds
+    return False
+
+
+def _read_head_sha(git_dir: Path) -> str:
+    """Return the object id HEAD resolves to, or "" if it cannot be read."""
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return ""
+    if head.startswith("ref: "):
+        return _read_ref(git_dir, head.removeprefix("ref: ")) or ""
+    return head
 
 
-def git_checkout(path: Path, branch: str) -> None:
-    """Check out *branch* in the repo at *path*."""
-    subprocess.run(["git", "-C", str(path), "checkout", branch])
+def _read_ref(git_dir: Path, ref: str) -> str | None:
+    """Return the object id *ref* resolves to, checking loose refs then packed-refs."""
+    refs_dir = _refs_dir(git_dir)
+    try:
+        value = (refs_dir / ref).read_text().strip()
+    except OSError:
+        value = None
+    if value is not None:
+        if value.startswith("ref: "):
+            return _read_ref(git_dir, value.removeprefix("ref: "))
+        return value
+
+    try:
+        packed = (refs_dir / "packed-refs").read_text()
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        object_id, _, name = line.partition(" ")
+        if name == ref:
+            return object_id
+    return None
 
 
 # ---------------------------------------------------------------------------
 
 
-def check_or_clone_repo(config: dict) -> bool:
+@dataclass(slots=True)
+class RepoStatus:
+    """Outcome of checking one repository, read once so callers need not ask git again."""
+
+    changed: bool
+    head_sha: str
+    branch: str
+
+
+def check_or_clone_repo(config: dict) -> RepoStatus:
     """
     Check if repository exists, clone if not, pull if exists.
-    Returns True if any changes were made.
+    Returns its status; ``changed`` is True if any changes were made.
+    """
+    return check_or_clone_repos([config["denovo_benchmarks"]])[0]
+
+
+def check_or_clone_repos(repos: list[dict]) -> list[RepoStatus]:
+    """
+    Check, clone or pull each repository in *repos* (dicts with local_path,
+    repo_url and branch, like the ``denovo_benchmarks`` config section).
+    Repositories are handled concurrently, since fetches are network-bound.
+    Returns the status of each repository, in order.
     """
     print_header("Repository Status")
 
-    repo_path = Path(__file__).parent.parent / config["denovo_benchmarks"]["local_path"]
-    repo_url = config["denovo_benchmarks"]["repo_url"]
-    branch = config["denovo_benchmarks"]["branch"]
+    if len(repos) == 1:
+        return [_check_repo(repos[0])]
+
+    # Each worker gets a copy of the caller's context so prints still reach the
+    # Prefect run logger (log_prints) from the pool threads
+    with ThreadPoolExecutor(max_workers=min(len(repos), 8)) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, _check_repo_buffered, repo)
+            for repo in repos
+        ]
+        return [future.result() for future in futures]
+
+
+def _check_repo_buffered(repo: dict) -> RepoStatus:
+    """Run _check_repo, writing its output as one block so concurrent repos don't interleave."""
+    with DisplayBuffer():
+        return _check_repo(repo)
+
+
+def _check_repo(repo: dict) -> RepoStatus:
+    """Check, clone or pull *repo*, then read its resulting HEAD from ``.git``."""
+    changed = _check_one(repo)
+    git_dir = _git_dir(RUNNER_DIR / repo["local_path"])
+    if git_dir is None:
+        return RepoStatus(changed=changed, head_sha="", branch="")
+    return RepoStatus(
+        changed=changed, head_sha=_read_head_sha(git_dir), branch=_read_branch(git_dir)
+    )
+
+
+def _check_one(repo: dict) -> bool:
+    """Check, clone or pull a single repository. Returns True if it changed."""
+    repo_path = RUNNER_DIR / repo["local_path"]
+    repo_url = repo["repo_url"]
+    branch = repo["branch"]
 
     if not repo_path.exists():
         print_step(f"Repository not found at: {repo_path}")
@@ -88,23 +319,24 @@ def check_or_clone_repo(config: dict) -> bool:
             print_success(f"Repository cloned successfully to {repo_path}")
             return True
         else:
-            print("✗ Error cloning repository")
+            print_error("Error cloning repository")
             sys.exit(1)
     else:
         print_step(f"Repository exists at: {repo_path}")
 
-        current_branch = git_get_branch(repo_path)
+        # Branch check, fetch and behind-count in one go
+        print_step("Checking for updates...")
+        current_branch, commits_behind = git_status(
+            repo_path, branch, fetch_ttl=repo.get("fetch_ttl_sec", DEFAULT_FETCH_TTL_SEC)
+        )
 
-        if current_branch != branch:
+        switched = current_branch != branch
+        if switched:
             print_warning(f"Repository is on branch '{current_branch}', expected '{branch}'")
             print_step(f"Switching to branch '{branch}'...")
-            git_checkout(repo_path, branch)
-
-        # Fetch latest
-        print_step("Checking for updates...")
-        git_fetch(repo_path)
-
-        commits_behind = git_count_behind(repo_path, branch)
+            if not git_checkout(repo_path, branch):
+                print_error(f"Error switching to branch '{branch}'")
+                return False
 
         if commits_behind > 0:
             print_step(f"Repository is {commits_behind} commit(s) behind. Pulling...")
@@ -112,8 +344,8 @@ def check_or_clone_repo(config: dict) -> bool:
                 print_success("Repository updated successfully")
                 return True
             else:
-                print("✗ Error updating repository")
-                return False
+                print_error("Error updating repository")
+                return switched
         else:
             print_success("Repository is up to date")
-            return False
+            return switched
@@ -4,6 +4,8 @@ import subprocess
 import time
 from pathlib import Path
 
+from .paths import RUNNER_DIR
+
 
 def check_slurm_job_status(job_id: str) -> str:
     """
@@ -62,8 +64,7 @@ def check_job_logs_for_completion(
         log_dir: directory containing logs (defaults to runner/logs)
     """
     if log_dir is None:
-        runner_dir = Path(__file__).parent.parent
-        log_dir = runner_dir / "logs"
+        log_dir = RUNNER_DIR / "logs"
 
     if not log_dir.exists():
         return "unknown"
@@ -0,0 +1,120 @@
+"""On-disk cache for parsed files, keyed by file mtime and size.
+
+Parsing results are stored in a JSON index under the user's cache directory so
+that warm runs only pay for a ``stat()`` per file instead of a full re-parse.
+Any change to a file's mtime or size invalidates its entry, and entries for
+files that no longer exist are dropped whenever the index is written.
+"""
+
+import copy
+import json
+import os
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "denovo_runner"
+    / "parse_cache.json"
+)
+
+_lock = threading.Lock()
+_index: dict[str, dict] | None = None
+# Nesting depth of deferred_writes() blocks, and whether the index has unwritten changes
+_deferred = 0
+_dirty = False
+
+
+def _load_index() -> dict[str, dict]:
+    """Return the in-memory index, reading it from disk on first use."""
+    global _index
+    if _index is None:
+        try:
+            _index = json.loads(CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            _index = {}
+    return _index
+
+
+def _write_index(index: dict[str, dict]):
+    """
+    Atomically write *index* to disk, first dropping entries whose file is gone.
+    The cache is best-effort: errors are ignored.
+    """
+    stale = [key for key, entry in index.items() if not os.path.exists(entry.get("path", ""))]
+    for key in stale:
+        del index[key]
+
+    tmp_file = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps(index))
+        os.replace(tmp_file, CACHE_FILE)
+    except (OSError, TypeError, ValueError):
+        tmp_file.unlink(missing_ok=True)
+
+
+def _mark_dirty(index: dict[str, dict]):
+    """Write *index* now, or when the outermost deferred_writes() block exits (hold _lock)."""
+    global _dirty
+    if _deferred:
+        _dirty = True
+    else:
+        _write_index(index)
+
+
+@contextmanager
+def deferred_writes() -> Iterator[None]:
+    """Collapse all cache updates inside the block into a single index write on exit."""
+    global _deferred, _dirty
+    with _lock:
+        _deferred += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _deferred -= 1
+            if not _deferred and _dirty:
+                _dirty = False
+                _write_index(_load_index())
+
+
+def load_cached(path: Path, parse: Callable[[Path], Any]) -> Any:
+    """
+    Return ``parse(path)``, reusing the cached result if *path* is unchanged.
+    The parsed value must be JSON-serializable to be persisted. Entries are keyed
+    on *path* as given, so pass the same spelling of a path on every call.
+    """
+    stat = path.stat()
+    key = f"{parse.__module__}.{parse.__qualname__}:{path}"
+    stamp = [stat.st_mtime_ns, stat.st_size]
+
+    with _lock:
+        entry = _load_index().get(key)
+        if entry is not None and entry["stamp"] == stamp:
+            return copy.deepcopy(entry["value"])
+
+    value = parse(path)
+
+    with _lock:
+        index = _load_index()
+        index[key] = {"path": str(path), "stamp": stamp, "value": copy.deepcopy(value)}
+        _mark_dirty(index)
+
+    return value
+
+
+def _parse_yaml(path: Path) -> Any:
+    """Parse a YAML file."""
+    with open(path, "r") as f:
+        return yaml.safe_load(f)
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """Load a YAML file, skipping the parse when it has not changed since last time."""
+    return load_cached(path, _parse_yaml)
@@ -0,0 +1,6 @@
+"""Filesystem locations shared across the runner package."""
+
+from pathlib import Path
+
+# Repository checkout containing orchestrate.py, templates/, logs/ and config.yaml
+RUNNER_DIR = Path(__file__).parent.parent
@@ -6,70 +6,197 @@ equivalents that operate on a local "fake-remote" directory — all higher-level
 logic in alexandria.py and algorithm_runner.py then runs for real.
 """
 
+import os
+import re
+import shlex
 import subprocess
+from collections.abc import Iterator
 from pathlib import Path
 
+# Multiplex every SSH call over one persistent connection per host: the first
+# call starts a master that later calls reuse for ControlPersist seconds, so a
+# probe costs one remote command instead of a full TCP + SSH handshake.
+# BatchMode makes a missing key fail fast instead of hanging on a prompt.
+SSH_OPTIONS = [
+    "-o",
+    "ControlMaster=auto",
+    "-o",
+    f"ControlPath=/tmp/cm-{os.getuid()}-%C",
+    "-o",
+    "ControlPersist=600",
+    "-o",
+    "BatchMode=yes",
+]
+
+# rsync spawns its own ssh; hand it the same options so transfers reuse the master
+RSYNC_SSH = shlex.join(["ssh", *SSH_OPTIONS])
+
+
+def ssh_run(host: str, command: str, **kwargs) -> subprocess.CompletedProcess:
+    """Run *command* on *host* over the shared SSH connection.
+
+    Extra keyword arguments are passed through to :func:`subprocess.run`.
+    """
+    return subprocess.run(["ssh", *SSH_OPTIONS, host, command], **kwargs)
+
+
+def ssh_popen(host: str, command: str, **kwargs) -> subprocess.Popen:
+    """Start *command* on *host* over the shared SSH connection without waiting.
+
+    Extra keyword arguments are passed through to :class:`subprocess.Popen`.
+    """
+    return subprocess.Popen(["ssh", *SSH_OPTIONS, host, command], **kwargs)
+
 
 def remote_file_exists(host: str, path: str) -> bool:
     """Return True if *path* exists as a regular file on *host*."""
-    result = subprocess.run(
-        ["ssh", host, f'test -f {path} && echo "exists" || echo "missing"'],
+    result = ssh_run(
+        host,
+        f'test -f {path} && echo "exists" || echo "missing"',
         capture_output=True,
         text=True,
     )
     return result.stdout.strip() == "exists"
 
 
-def remote_dir_exists(host: str, path: str) -> bool:
-    """Return True if *path* exists as a directory on *host*."""
-    result = subprocess.run(
-        ["ssh", host, f'test -d {path} && echo "exists" || echo "missing"'],
+def remote_mkdir(host: str, path: str) -> None:
+    """Create *path* (and parents) on *host* via SSH."""
+    ssh_run(host, f"mkdir -p {path}")
+
+
+def remote_test_many(host: str, checks: list[tuple[str, str]]) -> list[bool]:
+    """Run ``test <flag> <path>`` for every ``(flag, path)`` pair in one SSH session.
+
+    The probes are sent as a script on stdin to a single ``bash -s`` so the
+    connection and shell start-up cost is paid once, not once per path.
+    Returns one bool per check, in the same order as *checks*. Each answer is
+    tagged with its check's index, so stray output from the remote shell (e.g.
+    a login script's echo) cannot shift answers onto the wrong paths; a check
+    without an answer counts as missing.
+    """
+    if not checks:
+        return []
+    script = "".join(
+        f'test {flag} {shlex.quote(path)} && echo "{index} exists" || echo "{index} missing"\n'
+        for index, (flag, path) in enumerate(checks)
+    )
+    result = ssh_run(
+        host,
+        "bash -s",
+        input=script,
         capture_output=True,
         text=True,
     )
-    return result.stdout.strip() == "exists"
-
-
-def remote_mkdir(host: str, path: str) -> None:
-    """Create *path* (and parents) on *host* via SSH."""
-    subprocess.run(["ssh", host, f"mkdir -p {path}"])
+    found = set()
+    for line in result.stdout.split("\n"):
+        tag, _, answer = line.strip().partition(" ")
+        if answer == "exists" and tag.isdigit():
+            found.add(int(tag))
+    return [index in found for index in range(len(checks))]
 
 
-def remote_find(
+def remote_find_or_create(
     host: str,
     path: str,
     mindepth: int,
     maxdepth: int,
     type_: str = "d",
-) -> list[str]:
-    """Run ``find`` on *host* and return matching paths as a list of strings.
-
-    Returns an empty list when nothing is found or the command fails.
+    fields: tuple[int, ...] | None = None,
+) -> Iterator[str] | None:
+    """Run ``find`` under *path* on *host*, creating *path* first if it is missing.
+
+    The existence check, ``mkdir -p`` and ``find`` run in one SSH session.
+    Returns None when the directory did not exist (and has just been created),
+    otherwise an iterator over matching paths, streamed as ``find`` emits them
+    rather than buffered into one string first.
+
+    With *fields* (negative path-component indices, e.g. ``(-3, -1)``), only
+    those components are emitted, tab-separated, deduplicated and sorted on the
+    remote side with ``LC_ALL=C sort -u``.
     """
-    result = subprocess.run(
-        [
-            "ssh",
-            host,
-            f"find {path} -mindepth {mindepth} -maxdepth {maxdepth} -type {type_}",
-        ],
-        capture_output=True,
-        text=True,
+    quoted = shlex.quote(path)
+    find = f"find {quoted} -mindepth {mindepth} -maxdepth {maxdepth} -type {type_}"
+    if fields:
+        columns = ", ".join(f"$(NF{index + 1:+d})" if index < -1 else "$NF" for index in fields)
+        awk_program = f'BEGIN {{ OFS = "\\t" }} {{ print {columns} }}'
+        find += f" | awk -F/ {shlex.quote(awk_program)} | LC_ALL=C sort -u"
+    script = (
+        f"if [ -d {quoted} ]; then\n"
+        f'  echo "exists"\n'
+        f"  {find}\n"
+        f"else\n"
+        f"  mkdir -p {quoted}\n"
+        f'  echo "created"\n'
+        f"fi\n"
     )
-    if result.returncode == 0 and result.stdout.strip():
-        return result.stdout.strip().split("\n")
-    return []
-
-
-def remote_read_first_line(host: str, path: str) -> str | None:
-    """Return the first line of a remote file, or None on failure."""
-    result = subprocess.run(
-        ["ssh", host, f"head -n 1 {path}"],
-        capture_output=True,
+    proc = ssh_popen(
+        host,
+        "bash -s",
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
     )
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return None
+    # The script is far smaller than a pipe buffer, so this cannot block
+    proc.stdin.write(script)
+    proc.stdin.close()
+
+    # Skip any stray output from the remote shell ahead of the marker line
+    for line in proc.stdout:
+        marker = line.strip()
+        if marker in ("exists", "created"):
+            break
+    else:
+        marker = None
+
+    if marker != "exists":
+        proc.stdout.close()
+        proc.wait()
+        # No marker: the session failed, so there is nothing to list
+        return None if marker == "created" else iter(())
+    return _iter_lines(proc)
+
+
+def _iter_lines(proc: subprocess.Popen) -> Iterator[str]:
+    """Yield the non-empty stdout lines of *proc*, reaping it once exhausted."""
+    with proc:
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line:
+                yield line
+
+
+# One tagged answer line of remote_read_first_lines: "<index>+<header>" or "<index>-"
+_TAGGED_LINE_RE = re.compile(r"(\d+)([+-])(.*)")
+
+
+def remote_read_first_lines(host: str, paths: list[str]) -> list[str | None]:
+    """Return the first line of each remote file in *paths*, using one SSH session.
+
+    A file that is missing yields None in its position. Each answer is tagged
+    with its path's index and a ``+`` (header follows) or ``-`` (missing file),
+    so empty first lines, missing files and headers are told apart, and stray
+    output from the remote shell cannot shift headers onto the wrong paths.
+    """
+    if not paths:
+        return []
+    script = "".join(
+        f"if [ -f {quoted} ]; then printf '{index}+%s\\n' \"$(head -n 1 {quoted})\"; "
+        f"else echo '{index}-'; fi\n"
+        for index, quoted in enumerate(map(shlex.quote, paths))
+    )
+    result = ssh_run(host, "bash -s", input=script, capture_output=True, text=True)
+    headers: list[str | None] = [None] * len(paths)
+    # split("\n") rather than splitlines(): a header may contain \x0c, \x1c or
+    # \x85, which splitlines() would also break on
+    for line in result.stdout.split("\n"):
+        match = _TAGGED_LINE_RE.fullmatch(line)
+        if match is None:
+            continue
+        index = int(match.group(1))
+        if match.group(2) == "+" and index < len(paths):
+            headers[index] = match.group(3).strip()
+    return headers
 
 
 def rsync_pull(host: str, src: str, dst: Path) -> bool:
@@ -79,6 +206,6 @@ def rsync_pull(host: str, src: str, dst: Path) -> bool:
     """
     dst.parent.mkdir(parents=True, exist_ok=True)
     result = subprocess.run(
-        ["rsync", "-avz", "--progress", f"{host}:{src}", str(dst)],
+        ["rsync", "-avz", "--progress", "-e", RSYNC_SSH, f"{host}:{src}", str(dst)],
     )
     return result.returncode == 0
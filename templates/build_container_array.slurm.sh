@@ -0,0 +1,21 @@
+#!/bin/bash
+#SBATCH --job-name=build_array
+#SBATCH --output={RUNNER_DIR}/logs/array_build_%A_%a.out
+#SBATCH --error={RUNNER_DIR}/logs/array_build_%A_%a.err
+#SBATCH --array=0-{LAST_INDEX}
+#SBATCH --time={TIME}
+#SBATCH --cpus-per-task={CPUS}
+#SBATCH --mem={MEMORY}
+#SBATCH --partition={PARTITION}
+
+# One container build per array task. Each task runs that container's regular
+# build script, logging under the same names a standalone build job would use.
+# The wrapper's own logs above are named array_build_* so they never match the
+# build_<algo>_<version>_<job> pattern BuildState falls back to.
+BUILD_SCRIPTS=({BUILD_SCRIPTS})
+LOG_PREFIXES=({LOG_PREFIXES})
+
+TASK_ID=$SLURM_ARRAY_TASK_ID
+LOG="${{LOG_PREFIXES[$TASK_ID]}}_${{SLURM_ARRAY_JOB_ID}}_${{TASK_ID}}"
+
+exec bash "${{BUILD_SCRIPTS[$TASK_ID]}}" > "$LOG.out" 2> "$LOG.err"
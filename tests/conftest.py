@@ -0,0 +1,16 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from runner import parse_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_parse_cache(tmp_path: Path, monkeypatch):
+    """Point the parse cache at a fresh file and drop any in-memory index."""
+    monkeypatch.setattr(parse_cache, "CACHE_FILE", tmp_path / "cache" / "parse_cache.json")
+    monkeypatch.setattr(parse_cache, "_index", None)
+    monkeypatch.setattr(parse_cache, "_deferred", 0)
+    monkeypatch.setattr(parse_cache, "_dirty", False)
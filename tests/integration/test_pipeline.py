@@ -5,15 +5,16 @@ Mocking strategy — only mock the raw I/O primitives, never high-level logic:
   - runner.remote_fs.*   — SSH / rsync calls → replaced with local-filesystem
                            equivalents that operate on a mutable copy of the
                            static alexandria fixture directory.
-  - runner.git_ops.git_fetch / git_count_behind — network git operations;
-    the rest of check_or_clone_repo() runs for real against a git-init'd dir.
+  - runner.git_ops.git_status — fetch + behind-count network git operation;
+    the branch it reports and the rest of check_or_clone_repo() are real,
+    run against a git-init'd dir.
   - runner.algorithm_runner.get_runner_dir — returns the mutable asimov dir.
   - Slurm: submit_and_wait_for_* → raise AssertionError on any call.
 
 What runs for REAL (no mocking):
   - check_or_clone_repo()              full branch-check + update logic
   - check_outputs()                    directory traversal + path parsing
-  - check_containers()                 per-algo file-existence checks
+  - check_containers()                 batched file-existence checks
   - check_evaluation_container()       file-existence check
   - get_outputs_needing_augmentation() CSV header sniffing
   - pull_evaluation_container()        file-existence → early-return (file present)
@@ -53,6 +54,7 @@ from prefect.client.schemas.filters import (
 from prefect.testing.utilities import prefect_test_harness
 
 from runner.build_state import BuildState
+from runner.git_ops import git_get_branch
 
 # ---------------------------------------------------------------------------
 # Scenario directories (static, read-only, committed to the repo)
@@ -140,46 +142,80 @@ def _local_remote_file_exists(alex: Path):
     return _impl
 
 
-def _local_remote_dir_exists(alex: Path):
-    def _impl(host: str, path: str) -> bool:
-        return (alex / path.lstrip("/")).is_dir()
+def _local_remote_mkdir(alex: Path):
+    def _impl(host: str, path: str) -> None:
+        (alex / path.lstrip("/")).mkdir(parents=True, exist_ok=True)
 
     return _impl
 
 
-def _local_remote_mkdir(alex: Path):
-    def _impl(host: str, path: str) -> None:
-        (alex / path.lstrip("/")).mkdir(parents=True, exist_ok=True)
+def _local_find(alex: Path, path: str, mindepth: int, maxdepth: int, type_: str) -> list[str]:
+    """Local equivalent of the remote ``find`` run by remote_find_or_create."""
+    local_root = alex / path.lstrip("/")
+    results = []
+    for p in local_root.rglob("*"):
+        if type_ == "d" and not p.is_dir():
+            continue
+        if type_ == "f" and not p.is_file():
+            continue
+        depth = len(p.relative_to(local_root).parts)
+        if mindepth <= depth <= maxdepth:
+            results.append("/" + str(p.relative_to(alex)))
+    return results
+
+
+def _local_remote_test_many(alex: Path):
+    tests = {"-f": Path.is_file, "-d": Path.is_dir}
+
+    def _impl(host: str, checks: list[tuple[str, str]]) -> list[bool]:
+        return [tests[flag](alex / path.lstrip("/")) for flag, path in checks]
 
     return _impl
 
 
-def _local_remote_find(alex: Path):
-    def _impl(host: str, path: str, mindepth: int, maxdepth: int, type_: str = "d") -> list[str]:
+def _local_remote_find_or_create(alex: Path):
+    def _impl(
+        host: str,
+        path: str,
+        mindepth: int,
+        maxdepth: int,
+        type_: str = "d",
+        fields: tuple[int, ...] | None = None,
+    ) -> list[str] | None:
         local_root = alex / path.lstrip("/")
-        if not local_root.exists():
-            return []
-        results = []
-        for p in local_root.rglob("*"):
-            if type_ == "d" and not p.is_dir():
-                continue
-            if type_ == "f" and not p.is_file():
+        if not local_root.is_dir():
+            local_root.mkdir(parents=True, exist_ok=True)
+            return None
+        found = _local_find(alex, path, mindepth, maxdepth, type_)
+        if fields:
+            # Mirror the remote awk | sort -u reduction
+            parts = (found_path.split("/") for found_path in found)
+            return sorted({"\t".join(p[index] for index in fields) for p in parts})
+        return found
+
+    return _impl
+
+
+def _local_remote_read_first_lines(alex: Path):
+    def _impl(host: str, paths: list[str]) -> list[str | None]:
+        headers = []
+        for path in paths:
+            local_path = alex / path.lstrip("/")
+            if not local_path.is_file():
+                headers.append(None)
                 continue
-            depth = len(p.relative_to(local_root).parts)
-            if mindepth <= depth <= maxdepth:
-                results.append("/" + str(p.relative_to(alex)))
-        return results
+            with open(local_path) as f:
+                headers.append(f.readline().strip())
+        return headers
 
     return _impl
 
 
-def _local_remote_read_first_line(alex: Path):
-    def _impl(host: str, path: str) -> str | None:
-        local_path = alex / path.lstrip("/")
-        if not local_path.is_file():
-            return None
-        with open(local_path) as f:
-            return f.readline().strip()
+def _local_git_status(commits_behind: int):
+    """Report the real checked-out branch without fetching; *commits_behind* is fixed."""
+
+    def _impl(path: Path, branch: str, fetch_ttl: float = 0) -> tuple[str, int]:
+        return git_get_branch(path), commits_behind
 
     return _impl
 
@@ -201,6 +237,16 @@ def _slurm_must_not_run(name: str) -> MagicMock:
     return MagicMock(side_effect=AssertionError(f"Slurm job must not be submitted: {name}"))
 
 
+def _build_array_submits_all(config, builds, build_state):
+    """
+    Side-effect for ``submit_build_array``.
+
+    Accepts every build into the array without touching Slurm or the build
+    state. Returns ``{(algo, version): "job_array_<index>"}``.
+    """
+    return {build: f"job_array_{index}" for index, build in enumerate(builds)}
+
+
 def _build_creates_container(alex: Path):
     """
     Side-effect for ``submit_and_wait_for_build``.
@@ -210,7 +256,7 @@ def _build_creates_container(alex: Path):
     Returns ``(True, "job_build_<algo>")``.
     """
 
-    def _impl(config, algo_name, version, build_state):
+    def _impl(config, algo_name, version, build_state, job_id=None):
         containers_base = config["alexandria"]["containers_path"]
         if algo_name == "evaluation":
             sif = alex / (containers_base + "/evaluation/evaluation.sif").lstrip("/")
@@ -371,24 +417,25 @@ def _enter_infra_patches(
     """
     Enter all non-Slurm infrastructure patches into *stack*:
       - remote_fs primitives (SSH / rsync) → local-filesystem equivalents
-      - git network primitives → no-ops (git_count_behind configurable)
+      - git network primitives → no fetch (git_count_behind configurable)
       - get_runner_dir → *asimov*
       - load_config → *config*
       - cleanup_workspace → MagicMock
     """
     for target, side_effect in [
         ("runner.alexandria.remote_file_exists", _local_remote_file_exists(alex)),
-        ("runner.alexandria.remote_dir_exists", _local_remote_dir_exists(alex)),
+        ("runner.alexandria.remote_test_many", _local_remote_test_many(alex)),
         ("runner.alexandria.remote_mkdir", _local_remote_mkdir(alex)),
-        ("runner.alexandria.remote_find", _local_remote_find(alex)),
-        ("runner.alexandria.remote_read_first_line", _local_remote_read_first_line(alex)),
+        ("runner.alexandria.remote_find_or_create", _local_remote_find_or_create(alex)),
+        ("runner.alexandria.remote_read_first_lines", _local_remote_read_first_lines(alex)),
         ("runner.algorithm_runner.remote_file_exists", _local_remote_file_exists(alex)),
         ("runner.algorithm_runner.rsync_pull", _local_rsync_pull(alex)),
     ]:
         stack.enter_context(patch(target, side_effect=side_effect))
 
-    stack.enter_context(patch("runner.git_ops.git_fetch"))
-    stack.enter_context(patch("runner.git_ops.git_count_behind", return_value=git_count_behind))
+    stack.enter_context(
+        patch("runner.git_ops.git_status", side_effect=_local_git_status(git_count_behind))
+    )
     stack.enter_context(patch("runner.algorithm_runner.get_runner_dir", return_value=asimov))
     stack.enter_context(patch("runner.dataset_manager.get_runner_dir", return_value=asimov))
     stack.enter_context(patch("orchestrate.load_config", return_value=config))
@@ -466,20 +513,23 @@ def test_pipeline_all_complete(
         )
         stack.enter_context(
             patch(
-                "runner.alexandria.remote_dir_exists",
-                side_effect=_local_remote_dir_exists(alex),
+                "runner.alexandria.remote_test_many",
+                side_effect=_local_remote_test_many(alex),
             )
         )
         stack.enter_context(
             patch("runner.alexandria.remote_mkdir", side_effect=_local_remote_mkdir(alex))
         )
         stack.enter_context(
-            patch("runner.alexandria.remote_find", side_effect=_local_remote_find(alex))
+            patch(
+                "runner.alexandria.remote_find_or_create",
+                side_effect=_local_remote_find_or_create(alex),
+            )
         )
         stack.enter_context(
             patch(
-                "runner.alexandria.remote_read_first_line",
-                side_effect=_local_remote_read_first_line(alex),
+                "runner.alexandria.remote_read_first_lines",
+                side_effect=_local_remote_read_first_lines(alex),
             )
         )
         stack.enter_context(
@@ -492,8 +542,7 @@ def test_pipeline_all_complete(
             patch("runner.algorithm_runner.rsync_pull", side_effect=_local_rsync_pull(alex))
         )
         # ── Git network primitives (no real remote needed) ───────────────────
-        stack.enter_context(patch("runner.git_ops.git_fetch"))
-        stack.enter_context(patch("runner.git_ops.git_count_behind", return_value=0))
+        stack.enter_context(patch("runner.git_ops.git_status", side_effect=_local_git_status(0)))
         # ── Point get_runner_dir() at our mutable asimov dir ─────────────────
         stack.enter_context(patch("runner.algorithm_runner.get_runner_dir", return_value=asimov))
         # ── Scaffolding ───────────────────────────────────────────────────────
@@ -503,6 +552,9 @@ def test_pipeline_all_complete(
         stack.enter_context(
             patch("orchestrate.submit_and_wait_for_build", _slurm_must_not_run("build"))
         )
+        stack.enter_context(
+            patch("orchestrate.submit_build_array", _slurm_must_not_run("build array"))
+        )
         stack.enter_context(
             patch("orchestrate.submit_and_wait_for_run", _slurm_must_not_run("run"))
         )
@@ -633,6 +685,9 @@ def test_pipeline_build_fails(
                 return_value=(False, "mock_job_build"),
             )
         )
+        stack.enter_context(
+            patch("orchestrate.submit_build_array", side_effect=_build_array_submits_all)
+        )
         stack.enter_context(
             patch("orchestrate.submit_and_wait_for_run", _slurm_must_not_run("run"))
         )
@@ -728,6 +783,9 @@ def test_pipeline_dataset_pull_fails(
                 side_effect=_build_creates_container(alex),
             )
         )
+        stack.enter_context(
+            patch("orchestrate.submit_build_array", side_effect=_build_array_submits_all)
+        )
         stack.enter_context(
             patch("orchestrate.submit_and_wait_for_run", _slurm_must_not_run("run"))
         )
@@ -826,6 +884,9 @@ def test_pipeline_algorithm_run_fails(
                 side_effect=_build_creates_container(alex),
             )
         )
+        stack.enter_context(
+            patch("orchestrate.submit_build_array", side_effect=_build_array_submits_all)
+        )
         # Run job fails: returns (False, job_id) → run_single_combination raises.
         stack.enter_context(
             patch(
@@ -944,6 +1005,9 @@ def test_pipeline_evaluation_fails(
                 side_effect=_build_creates_container(alex),
             )
         )
+        stack.enter_context(
+            patch("orchestrate.submit_build_array", side_effect=_build_array_submits_all)
+        )
         stack.enter_context(
             patch(
                 "orchestrate.submit_and_wait_for_run",
@@ -1060,6 +1124,9 @@ def test_pipeline_git_pull_fails(
         stack.enter_context(
             patch("orchestrate.submit_and_wait_for_build", _slurm_must_not_run("build"))
         )
+        stack.enter_context(
+            patch("orchestrate.submit_build_array", _slurm_must_not_run("build array"))
+        )
         stack.enter_context(
             patch("orchestrate.submit_and_wait_for_run", _slurm_must_not_run("run"))
         )
@@ -1118,6 +1185,183 @@ def test_pipeline_git_pull_fails(
     assert (asimov / "evaluation.sif").exists()
 
 
+def test_pipeline_missing_checkout(
+    tmp_path: Path,
+    clean_build_state,
+) -> None:
+    """
+    Scenario: the denovo_benchmarks checkout does not exist yet, so the first
+    thing the pipeline does is clone it; everything else is already complete
+    (all_results_ready scenario).
+
+    Expected pipeline behaviour:
+      - main() waits for the clone before discovering algorithms.
+      - check_or_clone_repo() clones (git_clone copies the prepared checkout in)
+        and reports the repo as changed.
+      - Discovery and the container check run once: the clone was awaited, so
+        there is nothing to rediscover.
+      - Task counts are identical to test_pipeline_all_complete.
+    """
+    scenario = ALL_RESULTS_READY
+    asimov = _setup_mutable_asimov(scenario, tmp_path)
+    alex = _setup_mutable_alexandria(scenario, tmp_path)
+    benchmarks_dir = asimov / "denovo_benchmarks"
+    config = _make_config(benchmarks_dir)
+
+    # Move the checkout aside; "cloning" puts it back
+    upstream = tmp_path / "upstream_checkout"
+    shutil.move(benchmarks_dir, upstream)
+
+    def _clone(url: str, branch: str, path: Path) -> bool:
+        shutil.copytree(upstream, path)
+        return True
+
+    with ExitStack() as stack:
+        _enter_infra_patches(stack, asimov, alex, config)
+        clone = stack.enter_context(patch("runner.git_ops.git_clone", side_effect=_clone))
+        stack.enter_context(
+            patch("orchestrate.submit_and_wait_for_build", _slurm_must_not_run("build"))
+        )
+        stack.enter_context(
+            patch("orchestrate.submit_build_array", _slurm_must_not_run("build array"))
+        )
+        stack.enter_context(
+            patch("orchestrate.submit_and_wait_for_run", _slurm_must_not_run("run"))
+        )
+        stack.enter_context(
+            patch("orchestrate.submit_and_wait_for_pull", _slurm_must_not_run("pull"))
+        )
+        stack.enter_context(
+            patch("orchestrate.submit_and_wait_for_evaluation", _slurm_must_not_run("evaluate"))
+        )
+
+        with prefect_test_harness():
+            from orchestrate import main
+
+            state = main(return_state=True)
+            flow_run_id = str(state.state_details.flow_run_id)
+            task_runs, subflow_runs = asyncio.run(_fetch_all_run_states(flow_run_id))
+
+    # ── Prefect state assertions ──────────────────────────────────────────────
+    assert state.is_completed(), f"Top-level flow did not complete. State: {state.type}"
+    clone.assert_called_once()
+
+    failed_tasks = [tr for tr in task_runs if not tr.state.is_completed()]
+    assert not failed_tasks, "Tasks did not complete:\n" + "\n".join(
+        f"  {tr.name!r}: {tr.state.type}" for tr in failed_tasks
+    )
+
+    task_name_counts = Counter(tr.name.rsplit("-", 1)[0] for tr in task_runs)
+    # Identical to test_pipeline_all_complete — in particular discovery and the
+    # container check are not repeated after the clone.
+    expected_task_name_counts = Counter(
+        {
+            "Check Alexandria Outputs": 2,
+            "Analyze Container Build Status": 1,
+            "Analyze Missing Combinations": 1,
+            "Check Containers existance on Alexandria": 1,
+            "Check Evaluation Container on Alexandria": 1,
+            "Check Outputs Needing Augmentation": 1,
+            "Discover available algorithms": 1,
+            "Ensure denovo-benchmarks Repository": 1,
+            "Evaluate Datasets": 1,
+            "Find Datasets Needing Evaluation": 1,
+            "Pull Evaluation Container": 1,
+        }
+    )
+    assert task_name_counts == expected_task_name_counts, (
+        "Pipeline task structure has changed!\n"
+        "  Actual:   " + str(dict(task_name_counts.most_common())) + "\n"
+        "  Expected: " + str(dict(expected_task_name_counts.most_common()))
+    )
+    assert len(subflow_runs) == 1, (
+        f"Expected 1 subflow run (evaluate_datasets_flow), got {len(subflow_runs)}."
+    )
+
+
+def test_pipeline_repo_updated(
+    tmp_path: Path,
+    clean_build_state,
+) -> None:
+    """
+    Scenario: the checkout exists but is 2 commits behind, and the pull succeeds;
+    everything else is already complete (all_results_ready scenario).
+
+    Expected pipeline behaviour:
+      - Discovery and the container check run while the fetch/pull is in flight.
+      - check_or_clone_repo() pulls (git_pull_rebase succeeds) and reports the
+        repo as changed, so both are redone against the updated checkout.
+      - Otherwise task counts are identical to test_pipeline_all_complete.
+    """
+    scenario = ALL_RESULTS_READY
+    asimov = _setup_mutable_asimov(scenario, tmp_path)
+    alex = _setup_mutable_alexandria(scenario, tmp_path)
+    benchmarks_dir = asimov / "denovo_benchmarks"
+    config = _make_config(benchmarks_dir)
+
+    with ExitStack() as stack:
+        _enter_infra_patches(stack, asimov, alex, config, git_count_behind=2)
+        pull = stack.enter_context(patch("runner.git_ops.git_pull_rebase", return_value=True))
+        stack.enter_context(
+            patch("orchestrate.submit_and_wait_for_build", _slurm_must_not_run("build"))
+        )
+        stack.enter_context(
+            patch("orchestrate.submit_build_array", _slurm_must_not_run("build array"))
+        )
+        stack.enter_context(
+            patch("orchestrate.submit_and_wait_for_run", _slurm_must_not_run("run"))
+        )
+        stack.enter_context(
+            patch("orchestrate.submit_and_wait_for_pull", _slurm_must_not_run("pull"))
+        )
+        stack.enter_context(
+            patch("orchestrate.submit_and_wait_for_evaluation", _slurm_must_not_run("evaluate"))
+        )
+
+        with prefect_test_harness():
+            from orchestrate import main
+
+            state = main(return_state=True)
+            flow_run_id = str(state.state_details.flow_run_id)
+            task_runs, subflow_runs = asyncio.run(_fetch_all_run_states(flow_run_id))
+
+    # ── Prefect state assertions ──────────────────────────────────────────────
+    assert state.is_completed(), f"Top-level flow did not complete. State: {state.type}"
+    pull.assert_called_once_with(benchmarks_dir)
+
+    failed_tasks = [tr for tr in task_runs if not tr.state.is_completed()]
+    assert not failed_tasks, "Tasks did not complete:\n" + "\n".join(
+        f"  {tr.name!r}: {tr.state.type}" for tr in failed_tasks
+    )
+
+    task_name_counts = Counter(tr.name.rsplit("-", 1)[0] for tr in task_runs)
+    # As test_pipeline_all_complete, except that discovery and the container
+    # check are redone after the pull changed the repo.
+    expected_task_name_counts = Counter(
+        {
+            "Check Alexandria Outputs": 2,
+            "Analyze Container Build Status": 1,
+            "Analyze Missing Combinations": 1,
+            "Check Containers existance on Alexandria": 2,
+            "Check Evaluation Container on Alexandria": 1,
+            "Check Outputs Needing Augmentation": 1,
+            "Discover available algorithms": 2,
+            "Ensure denovo-benchmarks Repository": 1,
+            "Evaluate Datasets": 1,
+            "Find Datasets Needing Evaluation": 1,
+            "Pull Evaluation Container": 1,
+        }
+    )
+    assert task_name_counts == expected_task_name_counts, (
+        "Pipeline task structure has changed!\n"
+        "  Actual:   " + str(dict(task_name_counts.most_common())) + "\n"
+        "  Expected: " + str(dict(expected_task_name_counts.most_common()))
+    )
+    assert len(subflow_runs) == 1, (
+        f"Expected 1 subflow run (evaluate_datasets_flow), got {len(subflow_runs)}."
+    )
+
+
 def test_pipeline_fresh_start(
     tmp_path: Path,
     clean_build_state,
@@ -1197,20 +1441,23 @@ def test_pipeline_fresh_start(
         )
         stack.enter_context(
             patch(
-                "runner.alexandria.remote_dir_exists",
-                side_effect=_local_remote_dir_exists(alex),
+                "runner.alexandria.remote_test_many",
+                side_effect=_local_remote_test_many(alex),
             )
         )
         stack.enter_context(
             patch("runner.alexandria.remote_mkdir", side_effect=_local_remote_mkdir(alex))
         )
         stack.enter_context(
-            patch("runner.alexandria.remote_find", side_effect=_local_remote_find(alex))
+            patch(
+                "runner.alexandria.remote_find_or_create",
+                side_effect=_local_remote_find_or_create(alex),
+            )
         )
         stack.enter_context(
             patch(
-                "runner.alexandria.remote_read_first_line",
-                side_effect=_local_remote_read_first_line(alex),
+                "runner.alexandria.remote_read_first_lines",
+                side_effect=_local_remote_read_first_lines(alex),
             )
         )
         stack.enter_context(
@@ -1223,8 +1470,7 @@ def test_pipeline_fresh_start(
             patch("runner.algorithm_runner.rsync_pull", side_effect=_local_rsync_pull(alex))
         )
         # ── Git network primitives (no real remote needed) ───────────────────
-        stack.enter_context(patch("runner.git_ops.git_fetch"))
-        stack.enter_context(patch("runner.git_ops.git_count_behind", return_value=0))
+        stack.enter_context(patch("runner.git_ops.git_status", side_effect=_local_git_status(0)))
         # ── Point get_runner_dir() → asimov (for eval container path + DatasetManager) ─
         stack.enter_context(patch("runner.algorithm_runner.get_runner_dir", return_value=asimov))
         stack.enter_context(patch("runner.dataset_manager.get_runner_dir", return_value=asimov))
@@ -1238,6 +1484,9 @@ def test_pipeline_fresh_start(
                 side_effect=_build_creates_container(alex),
             )
         )
+        stack.enter_context(
+            patch("orchestrate.submit_build_array", side_effect=_build_array_submits_all)
+        )
         # ── Slurm: run creates augmented output.csv on Alexandria ─────────────
         stack.enter_context(
             patch(
@@ -0,0 +1,59 @@
+"""Unit tests for algorithm discovery."""
+
+from pathlib import Path
+
+import pytest
+
+from runner.algorithms import _parse_versions_log, get_algorithms
+
+
+class TestParseVersionsLog:
+    """Tests for _parse_versions_log."""
+
+    def _write(self, tmp_path: Path, content: str) -> Path:
+        versions_file = tmp_path / "versions.log"
+        versions_file.write_text(content)
+        return versions_file
+
+    def test_returns_container_version(self, tmp_path: Path):
+        versions_file = self._write(
+            tmp_path, 'container_version: "v4.2.1"\nalgorithm_version: "1.0.0"\n'
+        )
+        assert _parse_versions_log(versions_file) == "v4.2.1"
+
+    def test_returns_first_container_version(self, tmp_path: Path):
+        versions_file = self._write(
+            tmp_path, 'container_version: "bm-1.0.0"\ncontainer_version: "bm-0.9.0"\n'
+        )
+        assert _parse_versions_log(versions_file) == "bm-1.0.0"
+
+    def test_unquoted_first_entry_is_not_skipped(self, tmp_path: Path):
+        versions_file = self._write(
+            tmp_path, 'container_version: v5.0.0\ncontainer_version: "v4.2.1"\n'
+        )
+        with pytest.raises(ValueError, match="v5.0.0"):
+            _parse_versions_log(versions_file)
+
+    def test_returns_none_without_container_version(self, tmp_path: Path):
+        versions_file = self._write(tmp_path, 'algorithm_version: "1.0.0"\n')
+        assert _parse_versions_log(versions_file) is None
+
+    def test_returns_none_for_empty_file(self, tmp_path: Path):
+        versions_file = self._write(tmp_path, "")
+        assert _parse_versions_log(versions_file) is None
+
+
+class TestGetAlgorithms:
+    """Tests for get_algorithms."""
+
+    def test_unparseable_versions_log_is_skipped_with_warning(self, tmp_path: Path, capsys):
+        for name, content in (
+            ("casanovo", 'container_version: "v4.2.1"\n'),
+            ("adanovo", 'container_version: bm-1.0.0\ncontainer_version: "bm-0.9.0"\n'),
+        ):
+            (tmp_path / "algorithms" / name).mkdir(parents=True)
+            (tmp_path / "algorithms" / name / "versions.log").write_text(content)
+
+        config = {"denovo_benchmarks": {"local_path": str(tmp_path)}}
+        assert get_algorithms(config) == [{"name": "casanovo", "version": "v4.2.1"}]
+        assert "Could not parse" in capsys.readouterr().out
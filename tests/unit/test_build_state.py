@@ -0,0 +1,233 @@
+"""Unit tests for BuildState."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+from runner.build_state import BuildState
+
+
+def _completed(stdout: str = "", returncode: int = 0) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr="")
+
+
+class TestCheckJobStatuses:
+    """Tests for BuildState.check_job_statuses."""
+
+    def test_no_jobs_runs_no_commands(self, tmp_path: Path):
+        state = BuildState(tmp_path / "build_state.json")
+        with patch("runner.build_state.subprocess.run") as run:
+            assert state.check_job_statuses([]) == {}
+        run.assert_not_called()
+
+    def test_queued_jobs_skip_sacct(self, tmp_path: Path):
+        state = BuildState(tmp_path / "build_state.json")
+        with patch(
+            "runner.build_state.subprocess.run",
+            return_value=_completed("101 RUNNING\n102 PENDING\n"),
+        ) as run:
+            assert state.check_job_statuses(["101", "102"]) == {
+                "101": "running",
+                "102": "running",
+            }
+        assert run.call_count == 1
+        assert run.call_args.args[0][:3] == ["squeue", "-j", "101,102"]
+
+    def test_finished_jobs_use_one_sacct_call(self, tmp_path: Path):
+        state = BuildState(tmp_path / "build_state.json")
+        sacct_output = (
+            "102|COMPLETED\n102.batch|COMPLETED\n103|FAILED\n103.batch|FAILED\n104|CANCELLED by 0\n"
+        )
+        with patch(
+            "runner.build_state.subprocess.run",
+            side_effect=[_completed("101 RUNNING\n"), _completed(sacct_output)],
+        ) as run:
+            statuses = state.check_job_statuses(["101", "102", "103", "104"])
+
+        assert statuses == {
+            "101": "running",
+            "102": "completed",
+            "103": "failed",
+            "104": "failed",
+        }
+        assert run.call_count == 2
+        assert run.call_args.args[0][:3] == ["sacct", "-j", "102,103,104"]
+
+    def test_jobs_unknown_to_slurm_fall_back_to_logs(self, tmp_path: Path):
+        state = BuildState(tmp_path / "build_state.json")
+        with (
+            patch(
+                "runner.build_state.subprocess.run",
+                side_effect=[_completed(returncode=1), _completed("")],
+            ),
+            patch.object(BuildState, "_check_job_logs", return_value="unknown") as check_logs,
+        ):
+            assert state.check_job_statuses(["201"]) == {"201": "unknown"}
+        check_logs.assert_called_once_with("201")
+
+
+class TestCheckJobLogs:
+    """Tests for BuildState._check_job_logs."""
+
+    def _logs(self, tmp_path: Path, files: dict[str, str]) -> Path:
+        logs_dir = tmp_path / "logs"
+        logs_dir.mkdir()
+        for name, content in files.items():
+            (logs_dir / name).write_text(content)
+        return logs_dir
+
+    def test_array_task_log_ignores_wrapper_logs(self, tmp_path: Path):
+        self._logs(
+            tmp_path,
+            {
+                "build_array_123_0.err": "",
+                "array_build_123_0.err": "",
+                "build_casanovo_v4.2.1_123_0.err": "Container Build Complete!\n",
+            },
+        )
+        state = BuildState(tmp_path / "build_state.json")
+        with patch("runner.build_state.RUNNER_DIR", tmp_path):
+            assert state._check_job_logs("123_0") == "completed"
+
+    def test_failure_indicator(self, tmp_path: Path):
+        self._logs(tmp_path, {"build_casanovo_v4.2.1_124.err": "FATAL: While performing build\n"})
+        state = BuildState(tmp_path / "build_state.json")
+        with patch("runner.build_state.RUNNER_DIR", tmp_path):
+            assert state._check_job_logs("124") == "failed"
+
+
+class TestUpdateFromSlurm:
+    """Tests for BuildState.update_from_slurm."""
+
+    def test_updates_all_building_jobs_from_one_query(self, tmp_path: Path):
+        state = BuildState(tmp_path / "build_state.json")
+        state.mark_building("casanovo", "v4.2.1", "101")
+        state.mark_building("adanovo", "bm-1.0.0", "102")
+        state.mark_building("instanovo", "1.0", "103")
+
+        with patch.object(
+            BuildState,
+            "check_job_statuses",
+            return_value={"101": "completed", "102": "failed", "103": "running"},
+        ) as check:
+            updates = state.update_from_slurm()
+
+        check.assert_called_once_with(["101", "102", "103"])
+        assert updates == [
+            "✓ casanovo (v4.2.1) build completed",
+            "✗ adanovo (bm-1.0.0) build failed",
+        ]
+        assert state.get_status("casanovo", "v4.2.1")["status"] == "completed"
+        assert state.get_status("adanovo", "bm-1.0.0")["status"] == "failed"
+        assert state.get_status("instanovo", "1.0")["status"] == "building"
+
+    def test_verifies_completed_containers_in_one_ssh_call(self, tmp_path: Path):
+        state = BuildState(tmp_path / "build_state.json")
+        state.mark_building("casanovo", "v4.2.1", "101")
+        state.mark_building("adanovo", "bm-1.0.0", "102")
+        config = {"alexandria": {"host": "alex", "containers_path": "/containers"}}
+
+        with (
+            patch.object(
+                BuildState,
+                "check_job_statuses",
+                return_value={"101": "completed", "102": "completed"},
+            ),
+            patch("runner.build_state.remote_test_many", return_value=[True, False]) as probe,
+        ):
+            updates = state.update_from_slurm(config)
+
+        probe.assert_called_once_with(
+            "alex",
+            [
+                ("-f", "/containers/casanovo/v4.2.1/container.sif"),
+                ("-f", "/containers/adanovo/bm-1.0.0/container.sif"),
+            ],
+        )
+        assert updates == [
+            "✓ casanovo (v4.2.1) build completed",
+            "✗ adanovo (bm-1.0.0) build failed - container not found",
+        ]
+        assert state.get_status("adanovo", "bm-1.0.0")["status"] == "failed"
+
+    def test_verifies_evaluation_container_at_its_own_path(self, tmp_path: Path):
+        state = BuildState(tmp_path / "build_state.json")
+        state.mark_building("evaluation", "latest", "103")
+        config = {"alexandria": {"host": "alex", "containers_path": "/containers"}}
+
+        with (
+            patch.object(BuildState, "check_job_statuses", return_value={"103": "completed"}),
+            patch("runner.build_state.remote_test_many", return_value=[True]) as probe,
+        ):
+            updates = state.update_from_slurm(config)
+
+        probe.assert_called_once_with("alex", [("-f", "/containers/evaluation/evaluation.sif")])
+        assert updates == ["✓ evaluation (latest) build completed"]
+
+    def test_repeated_update_reuses_previous_query(self, tmp_path: Path):
+        state = BuildState(tmp_path / "build_state.json")
+        state.mark_building("casanovo", "v4.2.1", "101")
+
+        with patch.object(
+            BuildState, "check_job_statuses", return_value={"101": "completed"}
+        ) as check:
+            first = state.update_from_slurm()
+            second = state.update_from_slurm()
+
+        check.assert_called_once()
+        assert first == second == ["✓ casanovo (v4.2.1) build completed"]
+
+    def test_new_build_invalidates_previous_query(self, tmp_path: Path):
+        state = BuildState(tmp_path / "build_state.json")
+        state.mark_building("casanovo", "v4.2.1", "101")
+
+        with patch.object(BuildState, "check_job_statuses", return_value={"101": "running"}):
+            state.update_from_slurm()
+        state.mark_building("adanovo", "bm-1.0.0", "102")
+        with patch.object(
+            BuildState, "check_job_statuses", return_value={"101": "running", "102": "running"}
+        ) as check:
+            state.update_from_slurm()
+
+        check.assert_called_once_with(["101", "102"])
+
+
+class TestSave:
+    """Tests for BuildState state-file writes."""
+
+    def test_mark_writes_immediately(self, tmp_path: Path):
+        state_file = tmp_path / "build_state.json"
+        BuildState(state_file).mark_building("casanovo", "v4.2.1", "101")
+
+        assert BuildState(state_file).get_status("casanovo", "v4.2.1")["job_id"] == "101"
+        assert not state_file.with_suffix(".tmp").exists()
+
+    def test_deferred_saves_write_once(self, tmp_path: Path):
+        state = BuildState(tmp_path / "build_state.json")
+
+        with patch.object(
+            BuildState, "flush", autospec=True, side_effect=BuildState.flush
+        ) as flush:
+            with state.deferred_saves():
+                state.mark_building("casanovo", "v4.2.1", "101")
+                state.mark_building("adanovo", "bm-1.0.0", "102")
+                assert not state.state_file.exists()
+
+        flush.assert_called_once()
+        reloaded = BuildState(state.state_file)
+        assert reloaded.get_status("casanovo", "v4.2.1")["status"] == "building"
+        assert reloaded.get_status("adanovo", "bm-1.0.0")["status"] == "building"
+
+
+class TestLogContains:
+    """Tests for BuildState._log_contains."""
+
+    def test_matches_any_indicator(self, tmp_path: Path):
+        log_file = tmp_path / "build_casanovo_101.err"
+        log_file.write_text("INFO: building\nFATAL: While performing build\n")
+        assert BuildState._log_contains(log_file, ["Error:", "FATAL:"])
+
+    def test_no_match(self, tmp_path: Path):
+        log_file = tmp_path / "build_casanovo_101.err"
+        log_file.write_text("INFO: building\n")
+        assert not BuildState._log_contains(log_file, ["Error:", "FATAL:"])
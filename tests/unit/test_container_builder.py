@@ -0,0 +1,124 @@
+"""Unit tests for container build submission."""
+
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from runner.build_state import BuildState
+from runner.container_builder import check_and_display_builds, submit_build_array
+
+REPO_TEMPLATES = Path(__file__).parent.parent.parent / "templates"
+
+
+@pytest.fixture
+def runner_dir(tmp_path: Path) -> Path:
+    """A runner directory with the real templates and two algorithm definitions."""
+    shutil.copytree(REPO_TEMPLATES, tmp_path / "templates")
+    for algo_name in ("casanovo", "adanovo"):
+        algo_dir = tmp_path / "denovo_benchmarks" / "algorithms" / algo_name
+        algo_dir.mkdir(parents=True)
+        (algo_dir / "container.def").write_text("Bootstrap: docker\n")
+    (tmp_path / "logs").mkdir()
+    return tmp_path
+
+
+CONFIG = {
+    "denovo_benchmarks": {"local_path": "denovo_benchmarks"},
+    "alexandria": {"host": "alex", "containers_path": "/containers"},
+}
+
+
+class TestSubmitBuildArray:
+    """Tests for submit_build_array."""
+
+    def test_submits_one_array_job(self, runner_dir: Path):
+        build_state = BuildState(runner_dir / "build_state.json")
+        builds = [("casanovo", "v4.2.1"), ("adanovo", "bm-1.0.0")]
+
+        with (
+            patch("runner.container_builder.get_runner_dir", return_value=runner_dir),
+            patch(
+                "runner.container_builder.subprocess.run",
+                return_value=subprocess.CompletedProcess(
+                    args=[], returncode=0, stdout="Submitted batch job 500\n", stderr=""
+                ),
+            ) as run,
+        ):
+            job_ids = submit_build_array(CONFIG, builds, build_state)
+
+        run.assert_called_once()
+        assert job_ids == {("casanovo", "v4.2.1"): "500_0", ("adanovo", "bm-1.0.0"): "500_1"}
+        assert build_state.get_status("adanovo", "bm-1.0.0")["job_id"] == "500_1"
+
+        array_script = (runner_dir / "slurm_jobs" / "build_array.sh").read_text()
+        assert "#SBATCH --array=0-1" in array_script
+        assert str(runner_dir / "slurm_jobs" / "build_adanovo_bm-1.0.0.sh") in array_script
+        assert str(runner_dir / "logs" / "build_casanovo_v4.2.1") in array_script
+
+    def test_skips_builds_without_definition(self, runner_dir: Path):
+        build_state = BuildState(runner_dir / "build_state.json")
+        builds = [("casanovo", "v4.2.1"), ("missing", "1.0")]
+
+        with (
+            patch("runner.container_builder.get_runner_dir", return_value=runner_dir),
+            patch(
+                "runner.container_builder.subprocess.run",
+                return_value=subprocess.CompletedProcess(
+                    args=[], returncode=0, stdout="Submitted batch job 501\n", stderr=""
+                ),
+            ),
+        ):
+            job_ids = submit_build_array(CONFIG, builds, build_state)
+
+        assert job_ids == {("casanovo", "v4.2.1"): "501_0"}
+        assert build_state.get_status("missing", "1.0") is None
+
+    def test_failed_submission_returns_nothing(self, runner_dir: Path):
+        build_state = BuildState(runner_dir / "build_state.json")
+
+        with (
+            patch("runner.container_builder.get_runner_dir", return_value=runner_dir),
+            patch(
+                "runner.container_builder.subprocess.run",
+                return_value=subprocess.CompletedProcess(
+                    args=[], returncode=1, stdout="", stderr="sbatch: error"
+                ),
+            ),
+        ):
+            assert submit_build_array(CONFIG, [("casanovo", "v4.2.1")], build_state) == {}
+        assert build_state.get_status("casanovo", "v4.2.1") is None
+
+
+class TestCheckAndDisplayBuilds:
+    """Tests for check_and_display_builds."""
+
+    def test_all_containers_present_returns_early(self, tmp_path: Path):
+        build_state = BuildState(tmp_path / "build_state.json")
+        build_state.mark_building("casanovo", "v4.2.1", "101")
+        algorithms = [{"name": "casanovo", "version": "v4.2.1"}]
+
+        with (
+            patch("runner.container_builder.BuildState", return_value=build_state),
+            patch.object(BuildState, "check_job_statuses", return_value={"101": "running"}),
+        ):
+            needs_building, _ = check_and_display_builds(CONFIG, algorithms, {"casanovo": True})
+
+        assert needs_building == []
+        # Reconciliation still records the container Alexandria already has
+        assert build_state.get_status("casanovo", "v4.2.1")["status"] == "completed"
+
+    def test_no_running_builds_skips_slurm(self, tmp_path: Path):
+        build_state = BuildState(tmp_path / "build_state.json")
+        algorithms = [{"name": "casanovo", "version": "v4.2.1"}]
+
+        with (
+            patch("runner.container_builder.BuildState", return_value=build_state),
+            patch.object(BuildState, "update_from_slurm") as update,
+        ):
+            needs_building, _ = check_and_display_builds(CONFIG, algorithms, {"casanovo": False})
+
+        update.assert_not_called()
+        assert needs_building == [("casanovo", "v4.2.1")]
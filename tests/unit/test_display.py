@@ -0,0 +1,63 @@
+"""Unit tests for display helpers."""
+
+import threading
+from unittest.mock import patch
+
+from runner.display import DisplayBuffer, print_banner, print_header, print_success
+
+
+class TestPrintHeader:
+    """Tests for print_header."""
+
+    def test_layout(self, capsys):
+        print_header("Repository Status")
+        bar = "=" * 70
+        assert capsys.readouterr().out == f"\n{bar}\n  Repository Status\n{bar}\n\n"
+
+
+class TestPrintBanner:
+    """Tests for print_banner."""
+
+    def test_layout(self, capsys):
+        print_banner()
+        lines = capsys.readouterr().out.split("\n")
+        assert lines[0] == ""
+        assert lines[1] == lines[5] == "█" * 70
+        assert lines[2] == lines[4] == "█" + " " * 68 + "█"
+        assert "Denovo Benchmarks Orchestration System" in lines[3]
+        assert len(lines[3]) == 70
+
+
+class TestDisplayBuffer:
+    """Tests for DisplayBuffer."""
+
+    def test_output_is_written_on_exit(self, capsys):
+        with DisplayBuffer() as out:
+            print_success("done")
+            out.emit("    • casanovo")
+            assert capsys.readouterr().out == ""
+        assert capsys.readouterr().out == "  ✓ done\n    • casanovo\n"
+
+    def test_outputs_in_one_write(self):
+        with patch("builtins.print") as mock_print:
+            with DisplayBuffer() as out:
+                print_header("Summary")
+                out.emit("  • Completed: 3")
+        mock_print.assert_called_once()
+
+    def test_nested_buffer_folds_into_outer(self, capsys):
+        with DisplayBuffer() as outer:
+            outer.emit("first")
+            with DisplayBuffer() as inner:
+                inner.emit("second")
+            assert capsys.readouterr().out == ""
+        assert capsys.readouterr().out == "first\nsecond\n"
+
+    def test_buffer_is_per_thread(self, capsys):
+        with DisplayBuffer():
+            worker = threading.Thread(target=print_success, args=("from thread",))
+            worker.start()
+            worker.join()
+            assert capsys.readouterr().out == "  ✓ from thread\n"
+            print_success("from main")
+        assert capsys.readouterr().out == "  ✓ from main\n"
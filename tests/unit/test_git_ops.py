@@ -0,0 +1,238 @@
+"""Unit tests for git primitives."""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from runner.git_ops import (
+    RepoStatus,
+    check_or_clone_repos,
+    git_clone,
+    git_get_branch,
+    git_pull_rebase,
+    git_status,
+)
+
+
+def _git(*args: str) -> None:
+    subprocess.run(["git", *args], check=True, capture_output=True)
+
+
+@pytest.fixture
+def make_clone(tmp_path: Path, monkeypatch):
+    """Return a factory for clones whose upstream gained *behind* commits on main since."""
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "runner-tests")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "runner-tests@example.com")
+
+    def _make(behind: int) -> Path:
+        upstream = tmp_path / "upstream"
+        _git("init", "-q", "-b", "main", str(upstream))
+        _git("-C", str(upstream), "commit", "-q", "--allow-empty", "-m", "initial")
+        _git("clone", "-q", str(upstream), str(tmp_path / "clone"))
+        for index in range(behind):
+            _git("-C", str(upstream), "commit", "-q", "--allow-empty", "-m", f"commit {index}")
+        return tmp_path / "clone"
+
+    return _make
+
+
+@pytest.fixture
+def clone(make_clone) -> Path:
+    """A clone of a local upstream that has since gained two commits on main."""
+    return make_clone(behind=2)
+
+
+class TestGitClone:
+    """Tests for git_clone."""
+
+    def test_clone_is_shallow_and_can_pull(self, make_clone, tmp_path: Path):
+        upstream = make_clone(behind=2).parent / "upstream"
+        target = tmp_path / "shallow"
+
+        assert git_clone(upstream.as_uri(), "main", target)
+        shallow = subprocess.run(
+            ["git", "-C", str(target), "rev-parse", "--is-shallow-repository"],
+            capture_output=True,
+            text=True,
+        )
+        assert shallow.stdout.strip() == "true"
+
+        _git("-C", str(upstream), "commit", "-q", "--allow-empty", "-m", "later")
+        assert git_status(target, "main") == ("main", 1)
+        assert git_pull_rebase(target)
+        assert git_status(target, "main") == ("main", 0)
+
+    def test_clone_can_switch_to_another_branch(self, make_clone, tmp_path: Path):
+        upstream = make_clone(behind=0).parent / "upstream"
+        target = tmp_path / "shallow"
+        assert git_clone(upstream.as_uri(), "main", target)
+
+        # The configured branch changes after the clone was made
+        _git("-C", str(upstream), "branch", "dev")
+        _git("-C", str(upstream), "commit", "-q", "--allow-empty", "-m", "main only")
+        repo = {"local_path": str(target), "repo_url": upstream.as_uri(), "branch": "dev"}
+
+        (status,) = check_or_clone_repos([repo])
+
+        assert status.changed
+        assert status.branch == git_get_branch(target) == "dev"
+
+    def test_failed_branch_switch_is_reported(self, make_clone, tmp_path: Path, capsys):
+        upstream = make_clone(behind=0).parent / "upstream"
+        target = tmp_path / "shallow"
+        assert git_clone(upstream.as_uri(), "main", target)
+        repo = {"local_path": str(target), "repo_url": upstream.as_uri(), "branch": "missing"}
+
+        (status,) = check_or_clone_repos([repo])
+
+        assert not status.changed
+        assert status.branch == "main"
+        out = capsys.readouterr().out
+        assert "Error switching to branch 'missing'" in out
+        assert "up to date" not in out
+
+
+class TestGitStatus:
+    """Tests for git_status."""
+
+    def test_reports_branch_and_commits_behind(self, clone: Path):
+        assert git_status(clone, "main") == ("main", 2)
+
+    def test_up_to_date_branch_skips_fetch(self, make_clone):
+        clone = make_clone(behind=0)
+        assert git_status(clone, "main") == ("main", 0)
+        assert not (clone / ".git" / "FETCH_HEAD").exists()
+
+    def test_unknown_branch_counts_as_up_to_date(self, clone: Path):
+        assert git_status(clone, "release") == ("main", 0)
+
+    def test_recent_fetch_skips_network(self, clone: Path):
+        _git("-C", str(clone), "fetch", "-q")
+        upstream = clone.parent / "upstream"
+        _git("-C", str(upstream), "commit", "-q", "--allow-empty", "-m", "unseen")
+
+        # Within the TTL the count comes from the refs the last fetch left behind
+        assert git_status(clone, "main", fetch_ttl=3600) == ("main", 2)
+        assert git_status(clone, "main") == ("main", 3)
+
+    def test_recent_fetch_with_matching_tips_runs_nothing(self, make_clone):
+        clone = make_clone(behind=0)
+        _git("-C", str(clone), "fetch", "-q")
+
+        with patch("runner.git_ops._run") as run:
+            assert git_status(clone, "main", fetch_ttl=3600) == ("main", 0)
+        run.assert_not_called()
+
+    def test_packed_refs(self, clone: Path):
+        _git("-C", str(clone), "pack-refs", "--all")
+        assert not (clone / ".git" / "refs" / "heads" / "main").exists()
+        assert git_status(clone, "main") == ("main", 2)
+
+    def test_missing_repository(self, tmp_path: Path):
+        assert git_status(tmp_path / "missing", "main") == ("", 0)
+
+
+class TestGitGetBranch:
+    """Tests for git_get_branch."""
+
+    def test_current_branch(self, clone: Path):
+        _git("-C", str(clone), "checkout", "-q", "-b", "feature")
+        assert git_get_branch(clone) == "feature"
+
+    def test_detached_head(self, clone: Path):
+        _git("-C", str(clone), "checkout", "-q", "--detach")
+        assert git_get_branch(clone) == "HEAD"
+
+    def test_linked_worktree(self, clone: Path, tmp_path: Path):
+        worktree = tmp_path / "worktree"
+        _git("-C", str(clone), "worktree", "add", "-q", "-b", "side", str(worktree))
+        assert git_get_branch(worktree) == "side"
+        assert git_status(worktree, "main") == ("side", 2)
+
+
+class TestSpawn:
+    """Tests for how git primitives start their child processes."""
+
+    @pytest.mark.skipif(not subprocess._USE_POSIX_SPAWN, reason="posix_spawn unavailable")
+    def test_uses_posix_spawn(self, clone: Path):
+        with patch.object(
+            subprocess.Popen,
+            "_posix_spawn",
+            autospec=True,
+            side_effect=subprocess.Popen._posix_spawn,
+        ) as spawn:
+            assert git_status(clone, "main") == ("main", 2)
+        assert spawn.called
+
+
+class TestGitEnvironment:
+    """Tests for the environment git primitives run under."""
+
+    def test_disables_prompts_and_optional_locks(self, clone: Path):
+        with patch("runner.git_ops.subprocess.run", wraps=subprocess.run) as run:
+            git_pull_rebase(clone)
+        env = run.call_args.kwargs["env"]
+        assert env["GIT_TERMINAL_PROMPT"] == "0"
+        assert env["GIT_OPTIONAL_LOCKS"] == "0"
+        assert env["PATH"] == os.environ["PATH"]
+
+
+class TestCheckOrCloneRepos:
+    """Tests for check_or_clone_repos."""
+
+    def test_checks_every_repo_in_order(self, tmp_path: Path):
+        repos = []
+        for name in ("first", "second", "third"):
+            (tmp_path / name).mkdir()
+            repos.append({"local_path": str(tmp_path / name), "repo_url": "", "branch": "main"})
+
+        with (
+            patch(
+                "runner.git_ops.git_status",
+                side_effect=lambda path, branch, fetch_ttl: (
+                    "dev" if path.name == "second" else "main",
+                    0,
+                ),
+            ) as status,
+            patch("runner.git_ops.git_checkout") as checkout,
+        ):
+            statuses = check_or_clone_repos(repos)
+
+        # Only the repo that had to switch branches changed
+        assert [status.changed for status in statuses] == [False, True, False]
+        checked = sorted(call.args[0].name for call in status.call_args_list)
+        assert checked == ["first", "second", "third"]
+        checkout.assert_called_once_with(tmp_path / "second", "main")
+
+    def test_reports_head_of_checked_repo(self, clone: Path):
+        repo = {"local_path": str(clone), "repo_url": "", "branch": "main"}
+        head = subprocess.run(
+            ["git", "-C", str(clone), "rev-parse", "HEAD"], capture_output=True, text=True
+        ).stdout.strip()
+
+        with patch("runner.git_ops.git_pull_rebase", return_value=True):
+            (status,) = check_or_clone_repos([repo])
+
+        assert status == RepoStatus(changed=True, head_sha=head, branch="main")
+
+    def test_each_repo_output_is_one_write(self, tmp_path: Path):
+        repos = []
+        for name in ("first", "second"):
+            (tmp_path / name).mkdir()
+            repos.append({"local_path": str(tmp_path / name), "repo_url": "", "branch": "main"})
+
+        with (
+            patch("runner.git_ops.git_status", return_value=("main", 0)),
+            patch("builtins.print") as mock_print,
+        ):
+            check_or_clone_repos(repos)
+
+        # The header, then one block per repository
+        assert mock_print.call_count == 3
+        for call in mock_print.call_args_list[1:]:
+            assert call.args[0].endswith("Repository is up to date")
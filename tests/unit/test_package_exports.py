@@ -0,0 +1,18 @@
+"""Unit tests for the runner package's public exports."""
+
+import runner
+
+
+class TestPackageExports:
+    """Tests for runner.__all__."""
+
+    def test_all_names_resolve(self):
+        missing = [name for name in runner.__all__ if not hasattr(runner, name)]
+        assert missing == []
+
+    def test_no_duplicate_names(self):
+        assert len(runner.__all__) == len(set(runner.__all__))
+
+    def test_build_entry_points_exported(self):
+        for name in ("BuildState", "check_evaluation_container", "submit_build_array"):
+            assert name in runner.__all__
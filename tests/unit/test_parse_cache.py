@@ -0,0 +1,142 @@
+"""Unit tests for the mtime-keyed parse cache."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from runner import parse_cache
+
+# The autouse isolated_parse_cache fixture in tests/conftest.py gives every test
+# its own cache file.
+
+
+def _counting_parser(calls: list):
+    def _parse(path: Path) -> str:
+        calls.append(path)
+        return path.read_text()
+
+    return _parse
+
+
+class TestLoadCached:
+    """Tests for load_cached."""
+
+    def test_returns_parsed_value(self, tmp_path: Path):
+        data_file = tmp_path / "data.txt"
+        data_file.write_text("hello")
+        assert parse_cache.load_cached(data_file, _counting_parser([])) == "hello"
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path: Path):
+        data_file = tmp_path / "data.txt"
+        data_file.write_text("hello")
+        calls = []
+        parser = _counting_parser(calls)
+
+        parse_cache.load_cached(data_file, parser)
+        parse_cache.load_cached(data_file, parser)
+
+        assert len(calls) == 1
+
+    def test_cache_survives_process_restart(self, tmp_path: Path, monkeypatch):
+        data_file = tmp_path / "data.txt"
+        data_file.write_text("hello")
+        calls = []
+        parser = _counting_parser(calls)
+
+        parse_cache.load_cached(data_file, parser)
+        monkeypatch.setattr(parse_cache, "_index", None)
+
+        assert parse_cache.load_cached(data_file, parser) == "hello"
+        assert len(calls) == 1
+
+    def test_modified_file_is_reparsed(self, tmp_path: Path):
+        data_file = tmp_path / "data.txt"
+        data_file.write_text("hello")
+        calls = []
+        parser = _counting_parser(calls)
+
+        parse_cache.load_cached(data_file, parser)
+        data_file.write_text("changed!")
+        stat = data_file.stat()
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert parse_cache.load_cached(data_file, parser) == "changed!"
+        assert len(calls) == 2
+
+    def test_hit_does_not_resolve_path(self, tmp_path: Path):
+        data_file = tmp_path / "data.txt"
+        data_file.write_text("hello")
+        parser = _counting_parser([])
+        parse_cache.load_cached(data_file, parser)
+
+        with patch.object(Path, "resolve", side_effect=AssertionError("resolve() called")):
+            assert parse_cache.load_cached(data_file, parser) == "hello"
+
+    def test_entries_for_deleted_files_are_pruned(self, tmp_path: Path):
+        kept, removed = tmp_path / "kept.txt", tmp_path / "removed.txt"
+        kept.write_text("kept")
+        removed.write_text("removed")
+        parser = _counting_parser([])
+        parse_cache.load_cached(removed, parser)
+        removed.unlink()
+
+        parse_cache.load_cached(kept, parser)
+
+        index = json.loads(parse_cache.CACHE_FILE.read_text())
+        assert [entry["path"] for entry in index.values()] == [str(kept)]
+
+
+class TestDeferredWrites:
+    """Tests for deferred_writes."""
+
+    def test_misses_are_written_once(self, tmp_path: Path):
+        files = []
+        for name in ("a.txt", "b.txt", "c.txt"):
+            files.append(tmp_path / name)
+            files[-1].write_text(name)
+        parser = _counting_parser([])
+
+        with patch.object(
+            parse_cache, "_write_index", side_effect=parse_cache._write_index
+        ) as write:
+            with parse_cache.deferred_writes():
+                for data_file in files:
+                    parse_cache.load_cached(data_file, parser)
+                assert not parse_cache.CACHE_FILE.exists()
+
+        write.assert_called_once()
+        assert len(json.loads(parse_cache.CACHE_FILE.read_text())) == 3
+
+    def test_hits_do_not_write(self, tmp_path: Path):
+        data_file = tmp_path / "data.txt"
+        data_file.write_text("hello")
+        parser = _counting_parser([])
+        parse_cache.load_cached(data_file, parser)
+
+        with patch.object(parse_cache, "_write_index") as write:
+            with parse_cache.deferred_writes():
+                parse_cache.load_cached(data_file, parser)
+
+        write.assert_not_called()
+
+
+class TestLoadYamlCached:
+    """Tests for load_yaml_cached."""
+
+    def test_parses_yaml(self, tmp_path: Path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("datasets:\n  - a\n  - b\nslurm:\n  cpus: 4\n")
+        assert parse_cache.load_yaml_cached(config_file) == {
+            "datasets": ["a", "b"],
+            "slurm": {"cpus": 4},
+        }
+
+    def test_returned_value_is_independent_of_cache(self, tmp_path: Path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("datasets:\n  - a\n")
+
+        first = parse_cache.load_yaml_cached(config_file)
+        first["datasets"].append("mutated")
+
+        assert parse_cache.load_yaml_cached(config_file) == {"datasets": ["a"]}
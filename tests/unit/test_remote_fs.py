@@ -0,0 +1,124 @@
+"""Unit tests for the batched remote-filesystem primitives."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+from runner.remote_fs import remote_find_or_create, remote_read_first_lines, remote_test_many
+
+
+def _run_locally(host: str, command: str, **kwargs) -> subprocess.CompletedProcess:
+    """Stand-in for ssh_run that executes the remote command in a local shell."""
+    return subprocess.run(["bash", "-c", command], **kwargs)
+
+
+def _noisy(command: str) -> str:
+    """Prefix *command* with the kind of output a chatty remote login script emits."""
+    return f"echo 'Welcome to alexandria'; echo exists; echo; {command}"
+
+
+def _run_noisy(host: str, command: str, **kwargs) -> subprocess.CompletedProcess:
+    return _run_locally(host, _noisy(command), **kwargs)
+
+
+class TestRemoteTestMany:
+    """Tests for remote_test_many."""
+
+    def test_answers_match_their_paths(self, tmp_path: Path):
+        present = tmp_path / "present.sif"
+        present.write_text("")
+        checks = [("-f", str(tmp_path / "missing.sif")), ("-f", str(present))]
+
+        with patch("runner.remote_fs.ssh_run", side_effect=_run_locally) as ssh:
+            assert remote_test_many("alex", checks) == [False, True]
+        ssh.assert_called_once()
+
+    def test_stray_shell_output_does_not_shift_answers(self, tmp_path: Path):
+        present = tmp_path / "present.sif"
+        present.write_text("")
+        checks = [("-f", str(tmp_path / "missing.sif")), ("-f", str(present))]
+
+        with patch("runner.remote_fs.ssh_run", side_effect=_run_noisy):
+            assert remote_test_many("alex", checks) == [False, True]
+
+
+class TestRemoteReadFirstLines:
+    """Tests for remote_read_first_lines."""
+
+    def test_reads_headers_and_flags_missing_files(self, tmp_path: Path):
+        augmented = tmp_path / "augmented.csv"
+        augmented.write_text("spectrum_id,SA,pred_RT\n1,0.9,12.0\n")
+        empty = tmp_path / "empty.csv"
+        empty.write_text("")
+        missing = tmp_path / "missing.csv"
+
+        with patch("runner.remote_fs.ssh_run", side_effect=_run_locally) as ssh:
+            headers = remote_read_first_lines("alex", [str(augmented), str(missing), str(empty)])
+
+        ssh.assert_called_once()
+        assert headers == ["spectrum_id,SA,pred_RT", None, ""]
+
+    def test_stray_shell_output_does_not_shift_headers(self, tmp_path: Path):
+        missing = tmp_path / "missing.csv"
+        augmented = tmp_path / "augmented.csv"
+        augmented.write_text("spectrum_id,SA,pred_RT\n")
+
+        with patch("runner.remote_fs.ssh_run", side_effect=_run_noisy):
+            headers = remote_read_first_lines("alex", [str(missing), str(augmented)])
+
+        assert headers == [None, "spectrum_id,SA,pred_RT"]
+
+    def test_header_with_form_feed_stays_one_line(self, tmp_path: Path):
+        odd = tmp_path / "odd.csv"
+        odd.write_text("a\x0cb,c\n")
+        plain = tmp_path / "plain.csv"
+        plain.write_text("x,y\n")
+
+        with patch("runner.remote_fs.ssh_run", side_effect=_run_locally):
+            headers = remote_read_first_lines("alex", [str(odd), str(plain)])
+
+        assert headers == ["a\x0cb,c", "x,y"]
+
+    def test_no_paths_skips_ssh(self):
+        with patch("runner.remote_fs.ssh_run") as ssh:
+            assert remote_read_first_lines("alex", []) == []
+        ssh.assert_not_called()
+
+
+def _popen_locally(host: str, command: str, **kwargs) -> subprocess.Popen:
+    """Stand-in for ssh_popen that starts the remote command in a local shell."""
+    return subprocess.Popen(["bash", "-c", command], **kwargs)
+
+
+class TestRemoteFindOrCreate:
+    """Tests for remote_find_or_create."""
+
+    def test_missing_directory_is_created(self, tmp_path: Path):
+        outputs = tmp_path / "outputs"
+        with patch("runner.remote_fs.ssh_popen", side_effect=_popen_locally):
+            assert remote_find_or_create("alex", str(outputs), mindepth=3, maxdepth=3) is None
+        assert outputs.is_dir()
+
+    def test_fields_are_reduced_and_sorted_remotely(self, tmp_path: Path):
+        for relative in ("casanovo/v1/ds2", "casanovo/v1/ds1", "adanovo/v2/ds1"):
+            (tmp_path / relative).mkdir(parents=True)
+
+        with patch("runner.remote_fs.ssh_popen", side_effect=_popen_locally):
+            found = remote_find_or_create(
+                "alex", str(tmp_path), mindepth=3, maxdepth=3, fields=(-3, -1)
+            )
+            lines = list(found)
+
+        assert lines == ["adanovo\tds1", "casanovo\tds1", "casanovo\tds2"]
+
+    def test_stray_shell_output_before_marker_is_skipped(self, tmp_path: Path):
+        (tmp_path / "casanovo" / "v1" / "ds1").mkdir(parents=True)
+
+        def _popen_noisy(host: str, command: str, **kwargs) -> subprocess.Popen:
+            return _popen_locally(host, "echo 'Welcome to alexandria'; " + command, **kwargs)
+
+        with patch("runner.remote_fs.ssh_popen", side_effect=_popen_noisy):
+            found = remote_find_or_create(
+                "alex", str(tmp_path), mindepth=3, maxdepth=3, fields=(-3, -1)
+            )
+            assert list(found) == ["casanovo\tds1"]